@@ -177,7 +177,7 @@ async def load_network_from_registry(network_name: str):
         registry = get_registry()
         design_id, manager = registry.load_from_registry(network_name)
 
-        state = manager.get_state()
+        state = manager.peek_state()
         validation = manager.validate_network()
 
         return {
@@ -663,7 +663,7 @@ async def delete_toolbox_agent(design_id: str, agent_name: str):
             raise HTTPException(status_code=404, detail=f"Network with design_id '{design_id}' not found")
 
         # Verify it's a toolbox agent
-        state = manager.get_state()
+        state = manager.peek_state()
         agent = state["agents"].get(agent_name)
         if not agent:
             raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
@@ -872,7 +872,7 @@ async def export_to_hocon(design_id: str, request: NetworkExportRequest):
         if not manager:
             raise HTTPException(status_code=404, detail=f"Network with design_id '{design_id}' not found")
 
-        state = manager.get_state()
+        state = manager.peek_state()
         network_name = state.get("network_name", "new_agent_network")
         # use a default if we don't have anything yet
         filename_for_manifest = state.get("network_name", "new_agent_network")
@@ -1020,7 +1020,7 @@ async def load_draft_session(design_id: str):
         # Load the draft
         loaded_design_id, manager = registry.load_draft_state(design_id)
 
-        state = manager.get_state()
+        state = manager.peek_state()
         operation_store = registry.get_operation_store(design_id)
         draft_info = operation_store.get_draft_info() if operation_store else {}
 
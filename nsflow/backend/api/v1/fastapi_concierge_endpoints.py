@@ -36,7 +36,7 @@ async def get_concierge_list(request: Request):
     :param request: The FastAPI Request object, used to extract headers.
     :return: JSON response from the NeuroSan service.
     """
-    ns_concierge_utils = NsConciergeUtils()
+    ns_concierge_utils = NsConciergeUtils.get_instance()
     try:
         # Extract metadata from headers
         metadata: Dict[str, Any] = ns_concierge_utils.get_metadata(request)
@@ -26,6 +26,7 @@ from fastapi.staticfiles import StaticFiles
 
 from nsflow.backend.api.router import router
 from nsflow.backend.db.database import init_nss_db
+from nsflow.backend.utils.agentutils.ns_concierge_utils import NsConciergeUtils
 from nsflow.backend.utils.tools.ns_configs_registry import NsConfigsRegistry
 
 # Get configurations from the environment
@@ -75,6 +76,7 @@ async def lifespan(_app: FastAPI):
         yield
     finally:
         logging.info("FastAPI is shutting down...")
+        await NsConciergeUtils.close_all()
 
 
 # Initialize FastAPI app with lifespan event
@@ -19,7 +19,6 @@ import json
 import logging
 from typing import Any
 from typing import Dict
-from typing import List
 
 from fastapi import WebSocket
 from fastapi import WebSocketDisconnect
@@ -38,8 +37,9 @@ class RaiService:
 
     def __init__(self):
         """Initialize the RAI service with default metrics and connection management."""
-        # Dictionary mapping session_id to list of WebSocket connections
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+        # Dictionary mapping session_id to its WebSocket connections, kept as an insertion-ordered set
+        # (dict keys) so disconnects are O(1) instead of a list scan
+        self.active_connections: Dict[str, Dict[WebSocket, None]] = {}
         # Dictionary mapping session_id to current metrics
         self.session_metrics: Dict[str, Dict[str, str]] = {}
         self.calculator = SustainabilityCalculator()
@@ -171,11 +171,7 @@ class RaiService:
         """
         await websocket.accept()
 
-        # Initialize session connections list if not exists
-        if session_id not in self.active_connections:
-            self.active_connections[session_id] = []
-
-        self.active_connections[session_id].append(websocket)
+        self.active_connections.setdefault(session_id, {})[websocket] = None
         # self.logger.info(f"New sustainability metrics WebSocket client connected for session: {session_id}")
 
         # Send current metrics immediately upon connection
@@ -188,23 +184,28 @@ class RaiService:
             self.logger.error("Error sending initial metrics: %s", e)
 
         try:
-            # Keep connection alive and handle any incoming messages
+            # Wait for the client to go away; incoming messages are ignored.
+            # Awaiting receive() costs nothing while idle and returns as soon as the client disconnects.
             while True:
-                await asyncio.sleep(1)
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
         except WebSocketDisconnect:
-            if session_id in self.active_connections and websocket in self.active_connections[session_id]:
-                self.active_connections[session_id].remove(websocket)
-                # Clean up empty session lists
-                if not self.active_connections[session_id]:
-                    del self.active_connections[session_id]
+            self._remove_connection(session_id, websocket)
             # self.logger.info(f"Sustainability metrics WebSocket client disconnected for session: {session_id}")
         except Exception as e:
             self.logger.error("WebSocket error: %s", e)
-            if session_id in self.active_connections and websocket in self.active_connections[session_id]:
-                self.active_connections[session_id].remove(websocket)
-                # Clean up empty session lists
-                if not self.active_connections[session_id]:
-                    del self.active_connections[session_id]
+            self._remove_connection(session_id, websocket)
+
+    def _remove_connection(self, session_id: str, websocket: WebSocket):
+        """Forget a session's WebSocket client, dropping the session entry once it has none left."""
+        connections = self.active_connections.get(session_id)
+        if connections is None:
+            return
+        connections.pop(websocket, None)
+        # Clean up empty session entries
+        if not connections:
+            del self.active_connections[session_id]
 
     async def update_metrics_from_token_accounting(
         self, token_accounting: Dict[str, Any], agent_name: str = "ollama", session_id: str = "global"
@@ -244,7 +245,8 @@ class RaiService:
         Args:
             session_id: The session to broadcast to. If not provided, broadcasts to all sessions.
         """
-        if session_id not in self.active_connections or not self.active_connections[session_id]:
+        connections = self.active_connections.get(session_id)
+        if not connections:
             return
 
         # Get session-specific metrics
@@ -252,22 +254,22 @@ class RaiService:
         message = json.dumps(metrics)
         disconnected_clients = []
 
-        for websocket in self.active_connections[session_id]:
-            try:
-                await websocket.send_text(message)
-            except WebSocketDisconnect:
+        # Snapshot: clients may connect or disconnect while the sends are awaited.
+        # Sends run concurrently so one slow client does not hold up the rest.
+        clients = list(connections)
+        results = await asyncio.gather(
+            *(websocket.send_text(message) for websocket in clients), return_exceptions=True
+        )
+        for websocket, result in zip(clients, results):
+            if isinstance(result, WebSocketDisconnect):
                 disconnected_clients.append(websocket)
-            except Exception as e:
-                self.logger.error("Error broadcasting to WebSocket client: %s", e)
+            elif isinstance(result, Exception):
+                self.logger.error("Error broadcasting to WebSocket client: %s", result)
                 disconnected_clients.append(websocket)
 
         # Remove disconnected clients
         for websocket in disconnected_clients:
-            self.active_connections[session_id].remove(websocket)
-
-        # Clean up empty session lists
-        if not self.active_connections[session_id]:
-            del self.active_connections[session_id]
+            self._remove_connection(session_id, websocket)
 
         if disconnected_clients:
             self.logger.info(
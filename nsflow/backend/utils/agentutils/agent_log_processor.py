@@ -61,6 +61,10 @@ class AgentLogProcessor(MessageProcessor):
         self.logs_manager = LogsRegistry.register(agent_name, self.session_id)
         self.agent_name = agent_name
         self.logger = logging.getLogger(f"{self.agent_name}")
+        # Last origin trace logged, so a run of chunks from the same agents is logged once
+        self.last_otrace: Optional[list] = None
+        # Last internal chat entry sent, so a frame repeating it is not broadcast again
+        self.last_internal_chat: Optional[Dict[str, Any]] = None
 
     async def async_process_message(self, chat_message_dict: Dict[str, Any], message_type: ChatMessageType):
         """
@@ -136,19 +140,29 @@ class AgentLogProcessor(MessageProcessor):
                 tool_name = chat_message_dict.get("tool_result_origin", [{}])[-1].get("tool", "unknown")
                 internal_chat = f"result from {tool_name}\n{internal_chat}"
 
-        otrace_str = json.dumps({"otrace": otrace})
-        # Always send longs with a key "text" to any web socket
-        internal_chat_str = {"otrace": otrace, "text": internal_chat}
-        token_accounting_str = json.dumps({"token_accounting": token_accounting})
-        await self.logs_manager.log_event(f"{otrace_str}", "NeuroSan")
-        await self.logs_manager.internal_chat_event(internal_chat_str)
+        await self._send_otrace_and_internal_chat(otrace, internal_chat)
 
         if token_accounting:
+            # Only serialized when present; most streamed messages carry no token accounting
+            token_accounting_str = json.dumps({"token_accounting": token_accounting})
             await self.logs_manager.log_event(f"{token_accounting_str}", "NeuroSan")
             await RaiService.get_instance().update_metrics_from_token_accounting(
                 token_accounting, self.agent_name, self.session_id
             )
 
+    async def _send_otrace_and_internal_chat(self, otrace: list, internal_chat: Optional[str]):
+        """Send the origin trace and the internal chat entry, each only when it differs from the last one sent"""
+        if otrace != self.last_otrace:
+            self.last_otrace = otrace
+            otrace_str = json.dumps({"otrace": otrace})
+            await self.logs_manager.log_event(f"{otrace_str}", "NeuroSan")
+
+        # Always send longs with a key "text" to any web socket
+        internal_chat_str = {"otrace": otrace, "text": internal_chat}
+        if internal_chat_str != self.last_internal_chat:
+            self.last_internal_chat = internal_chat_str
+            await self.logs_manager.internal_chat_event(internal_chat_str)
+
     def _last_origin_tool(self, msg: Dict[str, Any]) -> Optional[str]:
         """Return the last tool in origin list"""
         origin = msg.get("origin")
@@ -205,11 +219,8 @@ class AgentLogProcessor(MessageProcessor):
                 if managers:
                     # Existing session - just update the state (adds to history)
                     manager = registry.get_primary_manager_for_network(network_name)
-                    design_id = None
-                    for did, mgr in managers.items():
-                        if mgr == manager:
-                            design_id = did
-                            break
+                    # Managers are registered under their own design_id
+                    design_id = manager.design_id
 
                     state_dict = manager.extract_state_from_progress(progress)
                     if state_dict:
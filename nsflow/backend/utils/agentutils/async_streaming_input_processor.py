@@ -73,18 +73,24 @@ class AsyncStreamingInputProcessor(StreamingInputProcessor):
         return_state: Dict[str, Any] = copy(state)
         returned_sly_data: Optional[Dict[str, Any]] = None
         chat_responses: Generator[Dict[str, Any], None, None] = self.session.streaming_chat(chat_request)
+        processor = self.processor
+        async_process_message = processor.async_process_message
+        received_response = False
         async for chat_response in self.async_wrap_iter(chat_responses):
             response: Dict[str, Any] = chat_response.get("response", empty)
             # Use the async version of the message processor
-            await self.processor.async_process_message(response)
+            await async_process_message(response)
+            received_response = True
             # Optionally add sleep(0) to ensure fair scheduling
             await asyncio.sleep(0)
 
-            # Update the state if there is something to update it with
-            chat_context = self.processor.get_chat_context()
-            last_chat_response = self.processor.get_compiled_answer()
-            returned_sly_data: Dict[str, Any] = self.processor.get_sly_data()
-            origin_str = Origination.get_full_name_from_origin(self.processor.get_answer_origin())
+        # The processor accumulates across the stream, so reading it once at the end
+        # yields the same state as refreshing it after every chunk
+        if received_response:
+            chat_context = processor.get_chat_context()
+            last_chat_response = processor.get_compiled_answer()
+            returned_sly_data = processor.get_sly_data()
+            origin_str = Origination.get_full_name_from_origin(processor.get_answer_origin())
 
         # Update the sly_data if new sly_data was returned
         if returned_sly_data is not None:
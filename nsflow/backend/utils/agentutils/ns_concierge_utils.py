@@ -14,10 +14,12 @@
 #
 # END COPYRIGHT
 
+import asyncio
 import json
-import socket
 from typing import Any
 from typing import Dict
+from typing import Optional
+from typing import Tuple
 
 import httpx
 from fastapi import HTTPException
@@ -26,35 +28,56 @@ from nsflow.backend.utils.logutils.websocket_logs_registry import LogsRegistry
 from nsflow.backend.utils.tools.ns_configs_registry import NsConfigsRegistry
 
 
-class NsConciergeUtils:
+class NsConciergeUtils:  # pylint: disable=too-many-instance-attributes  # server config plus a pooled HTTP client
     """
     Encapsulates concierge session management and interactions for a client.
     """
 
     DEFAULT_FORWARDED_REQUEST_METADATA: str = "request_id user_id"
 
+    # (config_id, forwarded_request_metadata) -> shared instance, see get_instance()
+    _instances: Dict[Tuple[str, str], "NsConciergeUtils"] = {}
+
     def __init__(self, agent_name: str = None, forwarded_request_metadata: str = DEFAULT_FORWARDED_REQUEST_METADATA):
         """
         Initialize the concierge service API wrapper.
         :param agent_name: This is just for keeping consistency with the logs.
         """
-        try:
-            config = NsConfigsRegistry.get_current()
-        except RuntimeError as e:
-            raise RuntimeError(
-                "No active NsConfigStore. \
-                               Please set it via /set_config before using endpoints."
-            ) from e
-
+        config = NsConfigsRegistry.require_current()
         self.server_host = config.host
         self.server_port = config.port
         self.connection = config.connection_type
 
         self.use_direct = False
-        self.forwarded_request_metadata = forwarded_request_metadata.split(" ")
+        # Split once, dropping duplicates and empty names but keeping the configured order
+        self.forwarded_request_metadata = tuple(dict.fromkeys(forwarded_request_metadata.split()))
 
         self.logs_manager = LogsRegistry.register(agent_name)
 
+        # Pooled HTTP client reused across list calls (keep-alive instead of a new connection per call),
+        # together with the event loop it was created on
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def get_instance(cls, forwarded_request_metadata: str = DEFAULT_FORWARDED_REQUEST_METADATA) -> "NsConciergeUtils":
+        """
+        Return a shared instance for the current NeuroSan server config, creating it on first use.
+        Keyed by the config id, so switching servers via /set_config gets a fresh instance.
+        :param forwarded_request_metadata: Space-separated header names to forward.
+        """
+        try:
+            config_id = NsConfigsRegistry.get_current().config_id
+        except RuntimeError:
+            # No config yet: let the constructor raise its descriptive error
+            return cls(forwarded_request_metadata=forwarded_request_metadata)
+
+        key = (config_id, forwarded_request_metadata)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances[key] = cls(forwarded_request_metadata=forwarded_request_metadata)
+        return instance
+
     def get_metadata(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract forwarded metadata from the Request headers.
@@ -62,11 +85,15 @@ class NsConciergeUtils:
         :param headers: Dictionary of incoming request headers.
         :return: Dictionary of metadata.
         """
-        headers: Dict[str, Any] = request.headers
         metadata: Dict[str, Any] = {}
+        if not self.forwarded_request_metadata:
+            return metadata
+        headers: Dict[str, Any] = request.headers
         for item_name in self.forwarded_request_metadata:
-            if item_name in headers.keys():
-                metadata[item_name] = headers[item_name]
+            # Headers.get() is already case-insensitive; headers.keys() would build a list per name
+            value = headers.get(item_name)
+            if value is not None:
+                metadata[item_name] = value
         return metadata
 
     async def list_concierge(self, metadata: Dict[str, Any]) -> Dict[str, Any]:  # pylint: disable=unused-argument  # kept for interface parity across concierge callers
@@ -76,13 +103,6 @@ class NsConciergeUtils:
         :param metadata: Metadata to be forwarded with the request (e.g., from headers).
         :return: Dictionary containing the result from the HTTP service.
         """
-        # fail fast if the server is not reachable
-        # This might not be always true when using a http sidecar for example
-        if self.server_host == "localhost" and not self.is_port_open(self.server_host, self.server_port, timeout=5.0):
-            raise HTTPException(
-                status_code=503, detail=f"NeuroSan server at {self.server_host}:{self.server_port} is not reachable"
-            )
-
         if str(self.server_host) in ("localhost", "127.0.0.1"):
             self.connection = "http"
         if self.server_port == "443":
@@ -91,41 +111,66 @@ class NsConciergeUtils:
             url = f"{self.connection}://{self.server_host}:{self.server_port}/api/v1/list"
 
         try:
-            async with httpx.AsyncClient(verify=True, headers={"host": self.server_host}) as client:
-                response = await client.get(
-                    url,
-                    headers={
-                        "User-Agent": "curl/8.7.1",
-                        "Accept": "*/*",
-                        "Host": self.server_host,  # important for SNI + proxying
-                    },
-                )
-                try:
-                    json_data = response.json()
-                except (httpx.HTTPError, json.JSONDecodeError):
-                    json_data = {
-                        "error": "The NeuroSan Server did not return valid JSON",
-                        "status_code": response.status_code,
-                        "text": response.text.strip(),
-                    }
-                return json_data
+            client = await self._get_http_client()
+            response = await client.get(
+                url,
+                headers={
+                    "User-Agent": "curl/8.7.1",
+                    "Accept": "*/*",
+                    "Host": self.server_host,  # important for SNI + proxying
+                },
+            )
+            try:
+                json_data = response.json()
+            except (httpx.HTTPError, json.JSONDecodeError):
+                json_data = {
+                    "error": "The NeuroSan Server did not return valid JSON",
+                    "status_code": response.status_code,
+                    "text": response.text.strip(),
+                }
+            return json_data
         except httpx.RequestError as exc:
+            # A failed connect to a local server means it is not running (yet).
+            # This might not be always true when using a http sidecar for example
+            if isinstance(exc, httpx.ConnectError) and self.server_host == "localhost":
+                raise HTTPException(
+                    status_code=503,
+                    detail=f"NeuroSan server at {self.server_host}:{self.server_port} is not reachable",
+                ) from exc
             await self.logs_manager.log_event(f"Failed to fetch concierge list: {exc}", "NeuroSan")
             raise HTTPException(status_code=502, detail=f"Failed to reach {url}: {str(exc)}") from exc
 
-    def is_port_open(self, host: str, port: int, timeout=1.0) -> bool:
+    async def _get_http_client(self) -> httpx.AsyncClient:
         """
-        Check if a port is open on a given host.
-        :param host: The hostname or IP address.
-        :param port: The port number to check.
-        :param timeout: Timeout in seconds for the connection attempt.
-        :return: True if the port is open, False otherwise.
+        Return the pooled HTTP client, creating it on first use.
+        Pooled connections belong to the event loop that opened them, so a client
+        created on another (e.g. since closed) loop is closed and replaced rather than reused.
         """
-        # Create a socket and set a timeout
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            try:
-                sock.connect((host, port))
-                return True
-            except Exception:
-                return False
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client.is_closed or self._http_client_loop is not loop:
+            await self.aclose()
+            self._http_client = httpx.AsyncClient(verify=True, headers={"host": self.server_host})
+            self._http_client_loop = loop
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if any. The next list call opens a new one."""
+        client = self._http_client
+        self._http_client = None
+        self._http_client_loop = None
+        if client is None or client.is_closed:
+            return
+        try:
+            await client.aclose()
+        except RuntimeError:
+            # Connections opened on an event loop that has since closed cannot be shut down
+            # from this one; that loop's transports are already gone
+            pass
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close the pooled HTTP clients of all shared instances and forget them. Called on app shutdown."""
+        instances = list(cls._instances.values())
+        cls._instances.clear()
+        for instance in instances:
+            await instance.aclose()
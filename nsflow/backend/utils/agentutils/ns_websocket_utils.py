@@ -15,7 +15,6 @@
 # END COPYRIGHT
 
 import asyncio
-import json
 import logging
 import os
 import tempfile
@@ -37,11 +36,18 @@ from nsflow.backend.utils.agentutils.async_streaming_input_processor import Asyn
 from nsflow.backend.utils.logutils.websocket_logs_registry import LogsRegistry
 from nsflow.backend.utils.mcp.mcp_oauth_manager import mcp_oauth_manager
 from nsflow.backend.utils.mcp.mcp_token_storage import FileTokenStorage
+from nsflow.backend.utils.tools.json_utils import json_dumps
+from nsflow.backend.utils.tools.json_utils import json_loads
 from nsflow.backend.utils.tools.ns_configs_registry import NsConfigsRegistry
 
-# Initialize a lock
-user_sessions_lock = asyncio.Lock()
-user_sessions = {}
+# Per session_id chat state shared by that session's websockets. Only touched from the event loop,
+# and setdefault keeps the first session created if two connects race, so no lock is needed.
+user_sessions: Dict[str, Dict[str, Any]] = {}
+
+# HTTP agent sessions are stateless request wrappers (conversation state travels in chat_context),
+# so one is shared per (utils class, connection, agent, host, port, use_direct, user_id)
+_shared_agent_sessions: Dict[tuple, Any] = {}
+_SHAREABLE_SESSION_TYPES = frozenset({"http", "https"})
 
 # Global storage for latest sly_data by network name and session
 # Key format: "agent_name:session_id"
@@ -65,6 +71,9 @@ REDACTED_VALUE = "***redacted***"
 # indefinitely (SDK defaults allow up to 30s connect / 300s read).
 MCP_FRESHEN_TIMEOUT_SECONDS = 15
 
+# Thinking file used when THINKING_FILE is not set; resolved once rather than per connection
+DEFAULT_THINKING_FILE = tempfile.gettempdir() + "/agent_thinking.txt"
+
 
 # pylint: disable=too-many-instance-attributes
 class NsWebsocketUtils:
@@ -77,6 +86,9 @@ class NsWebsocketUtils:
     """
 
     LOG_BUFFER_SIZE = 100
+    # Read once at import; run.py exports these before the server process starts
+    THINKING_FILE: Optional[str] = os.getenv("THINKING_FILE")
+    THINKING_DIR: Optional[str] = os.getenv("THINKING_DIR")
     DEFAULT_INPUT: str = ""
     DEFAULT_PROMPT: str = "Please enter your response ('quit' to terminate):\n"
 
@@ -88,14 +100,7 @@ class NsWebsocketUtils:
         :param session_id: Unique session identifier for this user connection.
                           If not provided, a new one will be generated.
         """
-        try:
-            config = NsConfigsRegistry.get_current()
-        except RuntimeError as e:
-            raise RuntimeError(
-                "No active NsConfigStore. \
-                               Please set it via /set_config before using endpoints."
-            ) from e
-
+        config = NsConfigsRegistry.require_current()
         self.server_host = config.host
         self.server_port = config.port
         self.connection = config.connection_type
@@ -107,10 +112,12 @@ class NsWebsocketUtils:
         self.active_chat_connections: Dict[str, WebSocket] = {}
         self.chat_context: Dict[str, Any] = {}
         # Set up the thinking file and directory from environment variables or defaults
-        if "THINKING_FILE" not in os.environ:
+        if self.THINKING_FILE is None:
             logging.warning("THINKING_FILE environment variable is not set. Using default temporary file.")
-        self.thinking_file = os.getenv("THINKING_FILE", tempfile.gettempdir() + "/agent_thinking.txt")
-        self.thinking_dir = os.getenv("THINKING_DIR", None)
+            self.thinking_file = DEFAULT_THINKING_FILE
+        else:
+            self.thinking_file = self.THINKING_FILE
+        self.thinking_dir = self.THINKING_DIR
         logging.info("Using thinking file: %s", self.thinking_file)
         logging.info("Using thinking dir: %s", self.thinking_dir)
 
@@ -128,22 +135,24 @@ class NsWebsocketUtils:
             f"Chat client {self.session_id} connected to agent: {self.agent_name}", "nsflow"
         )
 
-        async with user_sessions_lock:
-            if self.session_id not in user_sessions:
-                user_sessions[self.session_id] = await self.create_user_session(self.session_id)
-            user_session = user_sessions[self.session_id]
+        user_session = user_sessions.get(self.session_id)
+        if user_session is None:
+            user_session = user_sessions.setdefault(self.session_id, await self.create_user_session(self.session_id))
 
+        # Per-connection invariants, bound once rather than on every message
+        logs_manager = self.logs_manager
+        input_processor = user_session["input_processor"]
+        storage_key = f"{self.agent_name}:{self.session_id}"
         try:
             while True:
                 websocket_data = await websocket.receive_text()
-                message_data = json.loads(websocket_data)
+                message_data = json_loads(websocket_data)
                 user_input = message_data.get("message", "")
                 sly_data = message_data.get("sly_data", {})
                 chat_context = message_data.get("chat_context", {})
                 # log the chat_context message
-                await self.logs_manager.log_event(f"chat_context received: {chat_context}", "nsflow")
+                await logs_manager.log_event(f"chat_context received: {chat_context}", "nsflow")
 
-                input_processor = user_session["input_processor"]
                 state = user_session.get("state")
                 # Update user input in state
                 state["user_input"] = user_input
@@ -169,26 +178,25 @@ class NsWebsocketUtils:
                 # redacted copy so tokens never surface.
                 surfaced_sly_data = self.redact_sly_data_for_surface(state.get("sly_data"))
                 loggable_state = {**state, "sly_data": surfaced_sly_data}
-                await self.logs_manager.log_event(f"state after process_once: {loggable_state}", "nsflow")
+                await logs_manager.log_event(f"state after process_once: {loggable_state}", "nsflow")
                 user_session["state"] = state
                 last_chat_response = state.get("last_chat_response")
 
                 # Start a background task and pass necessary data
                 if last_chat_response:
                     # try:
-                    response_str = json.dumps({"message": {"type": "AI", "text": last_chat_response}})
+                    response_str = json_dumps({"message": {"type": "AI", "text": last_chat_response}})
                     sly_data_str = {"text": surfaced_sly_data}
                     await websocket.send_text(response_str)
-                    await self.logs_manager.log_event(f"Streaming response sent: {response_str}", "nsflow")
-                    await self.logs_manager.sly_data_event(sly_data_str)
+                    await logs_manager.log_event(f"Streaming response sent: {response_str}", "nsflow")
+                    await logs_manager.sly_data_event(sly_data_str)
 
                 # Store the latest sly_data for this network and session (redacted;
                 # this is served verbatim by GET /slydata).
                 if state.get("sly_data") is not None:
-                    storage_key = f"{self.agent_name}:{self.session_id}"
                     latest_sly_data_storage[storage_key] = surfaced_sly_data
 
-                await self.logs_manager.log_event(f"Streaming chat finished for client: {self.session_id}", "nsflow")
+                await logs_manager.log_event(f"Streaming chat finished for client: {self.session_id}", "nsflow")
 
         except WebSocketDisconnect:
             await self.logs_manager.log_event(f"WebSocket chat client disconnected: {self.session_id}", "nsflow")
@@ -198,8 +206,7 @@ class NsWebsocketUtils:
         finally:
             # clean up
             self.active_chat_connections.pop(self.session_id, None)
-            async with user_sessions_lock:
-                user_sessions.pop(self.session_id, None)
+            user_sessions.pop(self.session_id, None)
 
     async def create_user_session(self, sid: str) -> Dict[str, Any]:
         """method to create a user session with the given WebSocket connection.
@@ -237,14 +244,31 @@ class NsWebsocketUtils:
         return user_session
 
     def create_agent_session(self):
-        """Open a session with the factory"""
+        """Open a session with the factory, reusing the shared one for stateless HTTP connections"""
+        metadata: Dict[str, str] = {"user_id": os.environ.get("USER")}
+        key = None
+        if self.connection in _SHAREABLE_SESSION_TYPES:
+            key = (
+                type(self),
+                self.connection,
+                self.agent_name,
+                self.server_host,
+                self.server_port,
+                self.use_direct,
+                metadata["user_id"],
+            )
+            session = _shared_agent_sessions.get(key)
+            if session is not None:
+                return session
+
         # Open a session with the factory
         factory: AgentSessionFactory = self.get_agent_session_factory()
-        metadata: Dict[str, str] = {"user_id": os.environ.get("USER")}
         session = factory.create_session(
             self.connection, self.agent_name, self.server_host, self.server_port, self.use_direct, metadata
         )
         logging.info("Created agent session for agent: %s", str(session.get_request_path(self.connection)))
+        if key is not None:
+            _shared_agent_sessions[key] = session
         return session
 
     def get_connectivity(self):
@@ -19,6 +19,8 @@ Independent HOCON reader for the editor system.
 Removes dependency on AgentNetworkUtils to prevent conflicts.
 """
 
+import copy
+import functools
 import logging
 import os
 import re
@@ -27,12 +29,50 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from leaf_common.persistence.easy.easy_hocon_persistence import EasyHoconPersistence
 
 logger = logging.getLogger(__name__)
 
 
+# include "x.hocon", include file("x.hocon") and include required(...) of either; url/classpath includes are skipped
+_INCLUDE_RE = re.compile(r'^\s*include\s+(?:required\s*\(\s*)?(?:file\s*\(\s*)?"([^"]+)"', re.MULTILINE)
+
+
+def _hocon_file_mtimes(file_path: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    (path, mtime_ns) of a HOCON file and, recursively, of the files it includes.
+    Relative includes resolve against the working directory, as EasyHoconPersistence parses without a basedir.
+    A missing include gets mtime 0.
+    """
+    mtimes: Dict[str, int] = {}
+    pending = [file_path]
+    while pending:
+        path = pending.pop()
+        if path in mtimes:
+            continue
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            mtimes[path] = 0
+            continue
+        pending.extend(os.path.abspath(include) for include in _INCLUDE_RE.findall(text))
+    return tuple(sorted(mtimes.items()))
+
+
+@functools.lru_cache(maxsize=128)
+def _restore_hocon_file(file_path: str, mtimes: Tuple[Tuple[str, int], ...]) -> Dict[str, Any]:  # pylint: disable=unused-argument
+    """
+    Parse a HOCON file once per set of (path, mtime) of it and its includes.
+    mtimes is only part of the cache key, so editing the file or anything it includes parses it again.
+    """
+    hocon = EasyHoconPersistence(full_ref=file_path, must_exist=True)
+    return dict(hocon.restore())
+
+
 class IndependentHoconReader:
     """
     Independent HOCON reader that doesn't depend on AgentNetworkUtils.
@@ -115,10 +155,9 @@ class IndependentHoconReader:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"Network file not found: {file_path}")
 
-            # Use EasyHoconPersistence
-            hocon = EasyHoconPersistence(full_ref=file_path, must_exist=True)
-            config = hocon.restore()
-            return dict(config)
+            # Callers mutate the returned config, so hand out a copy of the cached parse
+            config = _restore_hocon_file(file_path, _hocon_file_mtimes(file_path))
+            return copy.deepcopy(config)
 
         except Exception as e:
             logger.error("Failed to read network config for '%s': %s", network_name, e)
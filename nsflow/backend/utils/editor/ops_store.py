@@ -20,15 +20,16 @@ import copy
 import json
 import logging
 import os
-from datetime import datetime
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from werkzeug.utils import secure_filename
 
 from nsflow.backend.utils.agentutils.agent_network_utils import ROOT_DIR
+from nsflow.backend.utils.editor.simple_state_manager import now_iso
 
 log = logging.getLogger("OperationStore")
 if not log.handlers:
@@ -37,8 +38,48 @@ if not log.handlers:
     log.addHandler(h)
     log.setLevel(logging.INFO)
 
+# Number of appended state deltas after which the base snapshot is rewritten in full
+_MAX_STATE_DELTAS = 50
 
-class OperationStore:
+
+def _state_delta(old: Dict[str, Any], new: Dict[str, Any], path: Tuple[str, ...] = ()) -> Dict[str, List[Any]]:
+    """
+    Minimal key-by-key diff between two state dicts.
+    Recurses into nested dicts; any other changed value is replaced wholesale.
+    Returns {"set": [[path, value], ...], "unset": [path, ...]}
+    """
+    delta: Dict[str, List[Any]] = {"set": [], "unset": []}
+    for key, value in new.items():
+        key_path = path + (key,)
+        if key not in old:
+            delta["set"].append([list(key_path), value])
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            nested = _state_delta(old[key], value, key_path)
+            delta["set"].extend(nested["set"])
+            delta["unset"].extend(nested["unset"])
+        elif old[key] != value:
+            delta["set"].append([list(key_path), value])
+    for key in old:
+        if key not in new:
+            delta["unset"].append(list(path + (key,)))
+    return delta
+
+
+def _apply_state_delta(state: Dict[str, Any], delta: Dict[str, List[Any]]) -> None:
+    """Apply a delta produced by _state_delta() to state in place"""
+    for key_path, value in delta.get("set", []):
+        target = state
+        for key in key_path[:-1]:
+            target = target.setdefault(key, {})
+        target[key_path[-1]] = value
+    for key_path in delta.get("unset", []):
+        target = state
+        for key in key_path[:-1]:
+            target = target.get(key, {})
+        target.pop(key_path[-1], None)
+
+
+class OperationStore:  # pylint: disable=too-many-instance-attributes  # draft file paths plus saved-delta bookkeeping
     """
     Simple, linear undo/redo via an operation log with precomputed inverses.
     - No graphs, no JSON Patch required.
@@ -46,7 +87,8 @@ class OperationStore:
 
     Files:
       root/
-        base_state.json      # snapshot when the store is created
+        base_state.json      # snapshot when the store is created, compacted on save
+        state_deltas.jsonl   # append-only: deltas on top of base_state.json since the last compaction
         history.jsonl        # append-only: {"ts", "forward", "inverse"}
         redo_stack.jsonl     # stack used only after undo
     """
@@ -72,10 +114,16 @@ class OperationStore:
         self.hist_file = os.path.join(self.root, "history.jsonl")
         self.redo_file = os.path.join(self.root, "redo_stack.jsonl")
         self.meta_file = os.path.join(self.root, "meta.json")
+        self.delta_file = os.path.join(self.root, "state_deltas.jsonl")
+
+        # Last state persisted through base_state.json + state_deltas.jsonl.
+        # None means unknown, so the next save rewrites the base snapshot in full.
+        self._last_saved_state: Optional[Dict[str, Any]] = None
+        self._delta_count = 0
 
         # Initialize files if they don't exist
         if not os.path.exists(self.base_file):
-            self._write_json(self.base_file, copy.deepcopy(self.manager.get_state()))
+            self._write_json(self.base_file, self.manager.get_state())
         if not os.path.exists(self.hist_file):
             with open(self.hist_file, "w", encoding="utf-8"):
                 pass
@@ -165,8 +213,9 @@ class OperationStore:
         Execute the forward op on manager and construct the exact inverse op.
         We read 'before' from manager.get_state() when needed.
         """
-        # We always read a deep copy of the state before applying mutating ops
-        before = copy.deepcopy(self.manager.get_state())
+        # We always read a deep copy of the state before applying mutating ops;
+        # get_state() already returns a private copy, so it is not copied again
+        before = self.manager.get_state()
 
         # Network-level operations
         if op == "set_network_name":
@@ -182,7 +231,7 @@ class OperationStore:
             state_dict = args["state_dict"]
             source = args.get("source", "ops_store")
             # Save current state as inverse
-            current_state = copy.deepcopy(before)
+            current_state = before
             ok = self.manager.update_network_state(network_name, state_dict, source)
             if not ok:
                 raise RuntimeError("update_network_state failed")
@@ -353,7 +402,7 @@ class OperationStore:
             # Restore complete state (used as inverse for update_network_state)
             state = args["state"]
             self.manager.current_state = copy.deepcopy(state)
-            return {"op": "restore_full_state", "args": {"state": copy.deepcopy(self.manager.get_state())}}
+            return {"op": "restore_full_state", "args": {"state": self.manager.get_state()}}
 
         if op == "restore_top_level_config":
             # Restore complete top-level config (used as inverse for update_top_level_config)
@@ -559,29 +608,60 @@ class OperationStore:
     # ----------------- Draft State Management -----------------
 
     def save_draft(self) -> bool:
-        """Save current state and update metadata"""
+        """
+        Save current state and update metadata.
+        Only the delta since the last save is appended to state_deltas.jsonl;
+        the base snapshot is rewritten when the delta log gets long.
+        A state equal to the one last saved is not written again.
+        """
         try:
-            # Update metadata
+            state = self.manager.get_state()
+            if self._last_saved_state is not None and self._last_saved_state == state:
+                log.info("Draft unchanged for design_id: %s", self.design_id)
+                return True
+
             meta = {
                 "design_id": self.design_id,
                 "created_at": self._read_json(self.meta_file).get("created_at", self._now()),
                 "last_saved": self._now(),
                 "version": "1.0",
-                "network_name": self.manager.get_state().get("network_name", ""),
-                "agent_count": len(self.manager.get_state().get("agents", {})),
+                "network_name": state.get("network_name", ""),
+                "agent_count": len(state.get("agents", {})),
                 "operation_count": len(self._read_jsonl(self.hist_file)),
             }
             self._write_json(self.meta_file, meta)
 
-            # Update base state to current state
-            self._write_json(self.base_file, copy.deepcopy(self.manager.get_state()))
-
+            if self._last_saved_state is None or self._delta_count >= _MAX_STATE_DELTAS:
+                # Compact: update base state to current state and drop the deltas
+                self._write_json(self.base_file, state)
+                self._write_jsonl(self.delta_file, [])
+                self._delta_count = 0
+            else:
+                delta = _state_delta(self._last_saved_state, state)
+                if delta["set"] or delta["unset"]:
+                    self._append_jsonl(self.delta_file, delta)
+                    self._delta_count += 1
+
+            # get_state() already hands out a deep copy, so it can be kept as is
+            self._last_saved_state = state
             log.info("Draft saved for design_id: %s", self.design_id)
             return True
         except Exception as e:
+            self.invalidate_saved_state()
             log.error("Failed to save draft: %s", e)
             return False
 
+    def invalidate_saved_state(self) -> None:
+        """Forget what was last persisted so the next save writes a full base snapshot"""
+        self._last_saved_state = None
+
+    def read_saved_state(self) -> Dict[str, Any]:
+        """Read the persisted state: the base snapshot with all saved deltas applied"""
+        state = self._read_json(self.base_file)
+        for delta in self._read_jsonl(self.delta_file):
+            _apply_state_delta(state, delta)
+        return state
+
     def get_draft_info(self) -> Dict[str, Any]:
         """Get draft metadata and statistics"""
         try:
@@ -653,7 +733,7 @@ class OperationStore:
             store = OperationStore(design_id, manager)
             # Load the base state into the manager
             # pylint: disable=protected-access  # helpers on our own OperationStore class
-            base_state = store._read_json(store.base_file)
+            base_state = store.read_saved_state()
             manager.current_state = copy.deepcopy(base_state)
 
             # Replay all operations to get to current state
@@ -673,7 +753,7 @@ class OperationStore:
 
     @staticmethod
     def _now() -> str:
-        return datetime.now().isoformat()
+        return now_iso()
 
     @staticmethod
     def _append_jsonl(path: str, obj: Dict[str, Any]) -> None:
@@ -698,6 +778,28 @@ class OperationStore:
                     out.append(json.loads(line))
         return out
 
+    @staticmethod
+    def _write_jsonl(path: str, rows: List[Dict[str, Any]]) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for r in rows:
+                f.write(json.dumps(r, ensure_ascii=False) + "\n")
+
+    @staticmethod
+    def _read_jsonl(path: str) -> List[Dict[str, Any]]:
+        if not os.path.exists(path):
+            return []
+        out = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    out.append(json.loads(line))
+        return out
+
+    @staticmethod
+    def _dump_json(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
     @staticmethod
     def _write_json(path: str, obj: Any) -> None:
         with open(path, "w", encoding="utf-8") as f:
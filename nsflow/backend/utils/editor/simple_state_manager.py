@@ -22,6 +22,8 @@ Designed for single-user editing sessions with simpler state management.
 import json
 import logging
 import os
+import sys
+import time
 import uuid
 from copy import deepcopy
 from datetime import datetime
@@ -29,11 +31,42 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 logger = logging.getLogger(__name__)
 
+# (millisecond since the epoch, ISO timestamp) of the last now_iso() call
+_ts_cache: Tuple[int, str] = (0, "")
 
-class SimpleStateManager:  # pylint: disable=too-many-public-methods  # cohesive state-editing API surface
+
+def now_iso() -> str:
+    """
+    Local ISO timestamp for bursty callers (log replays, draft history).
+    Calls landing in the same millisecond share one formatted string instead of re-formatting.
+    This is wall-clock time: values repeat within a millisecond and can step back if the clock
+    is adjusted, so never use them to tell two changes apart.
+    """
+    global _ts_cache  # pylint: disable=global-statement  # module-level timestamp cache
+    now_ns = time.time_ns()
+    cached = _ts_cache
+    if cached[0] != now_ns // 1_000_000:
+        cached = (now_ns // 1_000_000, datetime.fromtimestamp(now_ns / 1e9).isoformat())
+        _ts_cache = cached
+    return cached[1]
+
+
+def _intern_names(names: Any) -> Any:
+    """
+    Intern agent names parsed at runtime (HOCON, copilot JSON).
+    The same names are used as keys of the agents dict and as entries of every tools list,
+    so interning lets those lookups match on identity instead of comparing characters.
+    """
+    if not isinstance(names, list):
+        return names
+    return [sys.intern(name) if isinstance(name, str) else name for name in names]
+
+
+class SimpleStateManager:  # pylint: disable=too-many-public-methods,too-many-instance-attributes  # state+undo+caches
     """
     Simplified state manager for agent network editing.
     No locks, no complex async patterns - just simple state management.
@@ -43,10 +76,16 @@ class SimpleStateManager:  # pylint: disable=too-many-public-methods  # cohesive
 
     def __init__(self, design_id: Optional[str] = None):
         self.design_id = design_id or str(uuid.uuid4())
-        self.current_state: Dict[str, Any] = {}
+        self._current_state: Dict[str, Any] = {}
+        # Bumped by every state replacement and every in-place edit (they all go through _save_to_history)
+        self._mutations = 0
         self.state_history: List[Dict[str, Any]] = []
         self.history_index = -1
         self.max_history = 20  # Reduced for simplicity
+        # (mutation count, result) of the last validate_network call
+        self._validation_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        # (mutation count, content hash) stamped by the last update_network_state call
+        self._applied_update: Optional[Tuple[int, int]] = None
 
         if self.NSFLOW_PLUGIN_MANUAL_EDITOR:
             # Initialize empty state structure
@@ -66,8 +105,21 @@ class SimpleStateManager:  # pylint: disable=too-many-public-methods  # cohesive
             "agents": {},
         }
 
+    @property
+    def current_state(self) -> Dict[str, Any]:
+        """The live state dict being edited"""
+        return self._current_state
+
+    @current_state.setter
+    def current_state(self, state: Dict[str, Any]):
+        self._current_state = state
+        self._mutations += 1
+
     def _save_to_history(self):
         """Save current state to history for undo/redo"""
+        # Every in-place edit starts here, so this marks the state as changed
+        self._mutations += 1
+
         # Remove future history if we're not at the end
         if self.history_index < len(self.state_history) - 1:
             self.state_history = self.state_history[: self.history_index + 1]
@@ -111,6 +163,13 @@ class SimpleStateManager:  # pylint: disable=too-many-public-methods  # cohesive
         """Get current state"""
         return deepcopy(self.current_state)
 
+    def peek_state(self) -> Dict[str, Any]:
+        """
+        Get the live current state without copying it.
+        Read-only: callers must not mutate the returned dict; use get_state() for a private copy.
+        """
+        return self.current_state
+
     def set_network_name(self, network_name: str) -> bool:
         """Set network name"""
         try:
@@ -180,13 +239,13 @@ class SimpleStateManager:  # pylint: disable=too-many-public-methods  # cohesive
 
     def _load_agent_from_tool(self, tool: Dict[str, Any]):
         """Load agent from HOCON tool definition"""
-        agent_name = tool["name"]
+        agent_name = sys.intern(tool["name"])
 
         agent_def = {
             "name": agent_name,
             "instructions": tool.get("instructions", ""),
             "function": tool.get("function", {}),
-            "tools": tool.get("tools", []),
+            "tools": _intern_names(tool.get("tools", [])),
             "class": tool.get("class"),
             "toolbox": tool.get("toolbox"),
             "args": tool.get("args", {}),
@@ -226,19 +285,10 @@ class SimpleStateManager:  # pylint: disable=too-many-public-methods  # cohesive
             agent_network_definition = copilot_state.get("agent_network_definition", {})
 
             # Reset agents but keep top-level config
-            self.current_state["agents"] = {}
             self.current_state["network_name"] = network_name
 
             # Convert copilot format to our format
-            for agent_name, agent_data in agent_network_definition.items():
-                agent_def = {
-                    "name": agent_name,
-                    "instructions": agent_data.get("instructions", ""),
-                    "tools": agent_data.get("down_chains", []),
-                    "class": None,
-                    "_parent": None,
-                }
-                self.current_state["agents"][agent_name] = agent_def
+            self.current_state["agents"] = self._agents_from_definition(agent_network_definition)
 
             # Set parent relationships
             self._update_parent_relationships()
@@ -250,6 +300,20 @@ class SimpleStateManager:  # pylint: disable=too-many-public-methods  # cohesive
             logger.error("Failed to load from copilot state: %s", e)
             return False
 
+    @staticmethod
+    def _agents_from_definition(agent_network_definition: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a copilot agent_network_definition ({name: {instructions, down_chains}}) to our agents dict"""
+        return {
+            name: {
+                "name": name,
+                "instructions": agent_data.get("instructions", ""),
+                "tools": _intern_names(agent_data.get("down_chains", [])),
+                "class": None,
+                "_parent": None,
+            }
+            for name, agent_data in ((sys.intern(key), value) for key, value in agent_network_definition.items())
+        }
+
     def create_from_template(self, template_type: str, **kwargs) -> bool:
         """Create network from template"""
         try:
@@ -574,6 +638,18 @@ class SimpleStateManager:  # pylint: disable=too-many-public-methods  # cohesive
 
         return validation_result
 
+    def cached_validation(self) -> Dict[str, Any]:
+        """
+        Validate network structure, reusing the previous result while the state is unchanged.
+        Keyed on the mutation count rather than meta.updated_at, which can repeat within a millisecond.
+        """
+        if self._validation_cache is not None and self._validation_cache[0] == self._mutations:
+            return self._validation_cache[1]
+
+        validation_result = self.validate_network()
+        self._validation_cache = (self._mutations, validation_result)
+        return validation_result
+
     def export_to_hocon(self) -> Dict[str, Any]:
         """Export current state to HOCON format"""
         hocon_config = {}
@@ -695,12 +771,15 @@ class SimpleStateManager:  # pylint: disable=too-many-public-methods  # cohesive
         if "agent_network_definition" in progress_data:
             return progress_data
 
-        # Check nested structures
-        for _, value in progress_data.items():
-            if isinstance(value, dict) and "agent_network_definition" in value:
-                return value
-
-        return None
+        # Check nested structures (one level down), stopping at the first match
+        return next(
+            (
+                value
+                for value in progress_data.values()
+                if isinstance(value, dict) and "agent_network_definition" in value
+            ),
+            None,
+        )
 
     def update_network_state(self, network_name: str, state_dict: Dict[str, Any], source: str = "unknown") -> bool:
         """
@@ -713,35 +792,36 @@ class SimpleStateManager:  # pylint: disable=too-many-public-methods  # cohesive
         :return: True if update was successful
         """
         try:
-            # Save current state to history before making changes
-            # This ensures even the first update creates a history entry
-            self._save_to_history()
-
             # Extract agent network definition
             agent_network_definition = state_dict.get("agent_network_definition", {})
             network_name_from_dict = state_dict.get("agent_network_name", network_name)
 
-            # Clear current agents and reload from the state_dict
-            self.current_state["agents"] = {}
+            # Log replays often repeat the last update verbatim; while nothing else has touched
+            # the state since (mutation count unchanged), applying it again would only add a duplicate
+            # history entry, so skip the conversion altogether
+            update_hash = hash(
+                json.dumps([network_name_from_dict, source, agent_network_definition], sort_keys=True, default=str)
+            )
+            if self._applied_update == (self._mutations, update_hash):
+                return True
+
+            # Save current state to history before making changes
+            # This ensures even the first update creates a history entry
+            self._save_to_history()
+
+            # Replace current agents with the ones from the state_dict
             self.current_state["network_name"] = network_name_from_dict
 
             # Convert copilot format to our format
-            for agent_name, agent_data in agent_network_definition.items():
-                agent_def = {
-                    "name": agent_name,
-                    "instructions": agent_data.get("instructions", ""),
-                    "tools": agent_data.get("down_chains", []),
-                    "class": None,
-                    "_parent": None,
-                }
-                self.current_state["agents"][agent_name] = agent_def
+            self.current_state["agents"] = self._agents_from_definition(agent_network_definition)
 
             # Set parent relationships
             self._update_parent_relationships()
 
             # Update metadata
             self.current_state["meta"]["source"] = source
-            self.current_state["meta"]["updated_at"] = datetime.now().isoformat()
+            self.current_state["meta"]["updated_at"] = now_iso()
+            self._applied_update = (self._mutations, update_hash)
 
             return True
 
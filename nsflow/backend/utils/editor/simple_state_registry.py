@@ -19,16 +19,18 @@ Simplified registry that uses instance-based approach instead of class-level var
 No locks, no complex patterns - just simple state management.
 """
 
+import io
 import json
 import logging
 import os
 import shutil
+import threading
 import uuid
 from pathlib import Path
 from typing import Any
 from typing import Dict
-from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 
 from werkzeug.utils import secure_filename
@@ -38,11 +40,27 @@ from nsflow.backend.utils.agentutils.agent_network_utils import ROOT_DIR
 from nsflow.backend.utils.editor.hocon_reader import IndependentHoconReader
 from nsflow.backend.utils.editor.ops_store import OperationStore
 from nsflow.backend.utils.editor.simple_state_manager import SimpleStateManager
+from nsflow.backend.utils.tools.json_utils import json_dumps
 
 logger = logging.getLogger(__name__)
 
+
+def _encode_scalar(value: Any) -> str:
+    """
+    Encode a HOCON leaf value exactly as json.dumps would.
+    The orjson-backed json_dumps only takes plain ASCII strings, where its output is byte-identical:
+    orjson leaves non-ASCII and DEL unescaped, drops the spaces inside containers and writes NaN/Infinity as null.
+    """
+    if isinstance(value, str) and value.isascii() and "\x7f" not in value:
+        return json_dumps(value)
+    return json.dumps(value)
+
+
 _ALLOWED_EXPORT_EXTS = {".hocon", ".conf"}
 
+# Sentinel for an exhausted iterator in _dict_to_hocon_string
+_END = object()
+
 
 class SimpleStateRegistry:
     """
@@ -55,7 +73,7 @@ class SimpleStateRegistry:
     def __init__(self, edited_state_dir: Optional[str] = None):
         self.managers: Dict[str, SimpleStateManager] = {}
         self.operation_stores: Dict[str, OperationStore] = {}
-        self.network_to_design_ids: Dict[str, List[str]] = {}
+        self.network_to_design_ids: Dict[str, Set[str]] = {}
         self.design_id_to_info: Dict[str, Dict[str, Any]] = {}
 
         # Initialize HOCON reader
@@ -102,8 +120,8 @@ class SimpleStateRegistry:
 
                         # Update mappings
                         if network_name not in self.network_to_design_ids:
-                            self.network_to_design_ids[network_name] = []
-                        self.network_to_design_ids[network_name].append(design_id)
+                            self.network_to_design_ids[network_name] = set()
+                        self.network_to_design_ids[network_name].add(design_id)
 
                         # Get additional info from the restored state
                         meta = state.get("meta", {})
@@ -159,8 +177,8 @@ class SimpleStateRegistry:
 
         # Update mappings
         if network_name not in self.network_to_design_ids:
-            self.network_to_design_ids[network_name] = []
-        self.network_to_design_ids[network_name].append(design_id)
+            self.network_to_design_ids[network_name] = set()
+        self.network_to_design_ids[network_name].add(design_id)
 
         self.design_id_to_info[design_id] = {
             "network_name": network_name,
@@ -199,8 +217,8 @@ class SimpleStateRegistry:
             self.operation_stores[design_id] = operation_store
 
             if session_network_name not in self.network_to_design_ids:
-                self.network_to_design_ids[session_network_name] = []
-            self.network_to_design_ids[session_network_name].append(design_id)
+                self.network_to_design_ids[session_network_name] = set()
+            self.network_to_design_ids[session_network_name].add(design_id)
 
             self.design_id_to_info[design_id] = {
                 "network_name": session_network_name,
@@ -260,8 +278,8 @@ class SimpleStateRegistry:
 
         # Update mappings
         if session_network_name not in self.network_to_design_ids:
-            self.network_to_design_ids[session_network_name] = []
-        self.network_to_design_ids[session_network_name].append(design_id)
+            self.network_to_design_ids[session_network_name] = set()
+        self.network_to_design_ids[session_network_name].add(design_id)
 
         self.design_id_to_info[design_id] = {
             "network_name": session_network_name,
@@ -283,26 +301,34 @@ class SimpleStateRegistry:
 
     def get_managers_for_network(self, network_name: str) -> Dict[str, SimpleStateManager]:
         """Get all managers for a network name"""
-        design_ids = self.network_to_design_ids.get(network_name, [])
+        design_ids = self.network_to_design_ids.get(network_name, set())
         return {design_id: self.managers[design_id] for design_id in design_ids if design_id in self.managers}
 
     def get_primary_manager_for_network(self, network_name: str) -> Optional[SimpleStateManager]:
         """Get the most recently updated manager for a network"""
-        managers = self.get_managers_for_network(network_name)
+        managers = [
+            self.managers[design_id]
+            for design_id in self.network_to_design_ids.get(network_name, ())
+            if design_id in self.managers
+        ]
         if not managers:
             return None
 
-        # Find most recently updated
-        latest_manager = None
-        latest_time = None
+        # Managers are edited in place without telling the registry, so there is no index to keep
+        # current; a single max() pass over the network's sessions is the cheapest correct lookup.
+        # Design ids are kept in a set, so equal updated_at values are broken by created_at, not by set order
+        latest_manager = max(managers, key=self._updated_then_created)
+        if latest_manager.peek_state().get("meta", {}).get("updated_at"):
+            return latest_manager
 
-        for manager in managers.values():
-            updated_at = manager.current_state.get("meta", {}).get("updated_at")
-            if updated_at and (latest_time is None or updated_at > latest_time):
-                latest_time = updated_at
-                latest_manager = manager
+        # Design ids are kept in a set, so fall back to the earliest created session explicitly
+        return min(managers, key=lambda manager: manager.peek_state().get("meta", {}).get("created_at", ""))
 
-        return latest_manager or next(iter(managers.values()))
+    @staticmethod
+    def _updated_then_created(manager: SimpleStateManager) -> Tuple[str, str]:
+        """Sort key for picking the most recently updated session of a network"""
+        meta = manager.peek_state().get("meta", {})
+        return (meta.get("updated_at") or "", meta.get("created_at") or "")
 
     def list_all_networks(self) -> Dict[str, Any]:
         """List all networks - registry, in-memory editing sessions, and draft states"""
@@ -329,7 +355,7 @@ class SimpleStateRegistry:
             if design_id in self.managers:
                 manager = self.managers[design_id]
                 operation_store = self.operation_stores.get(design_id)
-                state = manager.get_state()
+                state = manager.peek_state()
 
                 # Get current network name from the actual state
                 current_network_name = state.get("network_name", "")
@@ -401,8 +427,8 @@ class SimpleStateRegistry:
 
             # Update mappings
             if network_name not in self.network_to_design_ids:
-                self.network_to_design_ids[network_name] = []
-            self.network_to_design_ids[network_name].append(design_id)
+                self.network_to_design_ids[network_name] = set()
+            self.network_to_design_ids[network_name].add(design_id)
 
             # Get additional info from the restored state
             meta = state.get("meta", {})
@@ -463,8 +489,7 @@ class SimpleStateRegistry:
 
             # Remove from mappings
             if network_name in self.network_to_design_ids:
-                if design_id in self.network_to_design_ids[network_name]:
-                    self.network_to_design_ids[network_name].remove(design_id)
+                self.network_to_design_ids[network_name].discard(design_id)
 
                 # Clean up empty network entries
                 if not self.network_to_design_ids[network_name]:
@@ -488,8 +513,8 @@ class SimpleStateRegistry:
 
         manager = self.managers[design_id]
         info = self.design_id_to_info.get(design_id, {})
-        state = manager.get_state()
-        validation = manager.validate_network()
+        state = manager.peek_state()
+        validation = manager.cached_validation()
 
         # Get the current network name from the actual state
         current_network_name = state.get("network_name", "")
@@ -604,41 +629,67 @@ class SimpleStateRegistry:
             return False
 
     def _dict_to_hocon_string(self, config: Dict[str, Any], indent: int = 0) -> str:
-        """Convert dictionary to HOCON-like string format"""
-        lines = []
-        indent_str = "  " * indent
-
-        for key, value in config.items():
+        """
+        Convert dictionary to HOCON-like string format.
+        Walks the config with an explicit stack and writes into a single buffer,
+        so nested levels are not re-joined at every depth.
+        """
+        out = io.StringIO()
+        # Frames: (iterator over dict items or list items, indent level, is_list, closing line, buffer offset)
+        stack = [(iter(config.items()), indent, False, None, 0)]
+
+        while stack:
+            items, level, is_list, closing, start = stack[-1]
+            item = next(items, _END)
+            if item is _END:
+                stack.pop()
+                if closing is not None:
+                    # A nested dict that produced no lines still leaves an empty line inside its braces
+                    if not is_list and out.tell() == start:
+                        out.write("\n")
+                    out.write(f"{closing}\n")
+                continue
+
+            indent_str = "  " * level
+            if is_list:
+                if isinstance(item, dict):
+                    out.write(f"{indent_str}  {{\n")
+                    stack.append((iter(item.items()), level + 2, False, f"{indent_str}  }}", out.tell()))
+                else:
+                    out.write(f"{indent_str}  {_encode_scalar(item)}\n")
+                continue
+
+            key, value = item
             if isinstance(value, dict):
-                lines.append(f"{indent_str}{key} = {{")
-                lines.append(self._dict_to_hocon_string(value, indent + 1))
-                lines.append(f"{indent_str}}}")
+                out.write(f"{indent_str}{key} = {{\n")
+                stack.append((iter(value.items()), level + 1, False, f"{indent_str}}}", out.tell()))
             elif isinstance(value, list):
                 if value:  # Only add non-empty lists
-                    lines.append(f"{indent_str}{key} = [")
-                    for item in value:
-                        if isinstance(item, dict):
-                            lines.append(f"{indent_str}  {{")
-                            lines.append(self._dict_to_hocon_string(item, indent + 2))
-                            lines.append(f"{indent_str}  }}")
-                        else:
-                            lines.append(f"{indent_str}  {json.dumps(item)}")
-                    lines.append(f"{indent_str}]")
-            elif isinstance(value, str):
-                lines.append(f"{indent_str}{key} = {json.dumps(value)}")
+                    out.write(f"{indent_str}{key} = [\n")
+                    stack.append((iter(value), level, True, f"{indent_str}]", out.tell()))
             elif value is not None:
-                lines.append(f"{indent_str}{key} = {json.dumps(value)}")
+                out.write(f"{indent_str}{key} = {_encode_scalar(value)}\n")
 
-        return "\n".join(lines)
+        # Drop the newline after the last line
+        return out.getvalue()[:-1]
 
 
 # Global instance - will be initialized when needed
 _registry_instance: Optional[SimpleStateRegistry] = None
+_registry_init_lock = threading.Lock()
 
 
 def get_registry() -> SimpleStateRegistry:
-    """Get or create the registry instance"""
+    """
+    Get or create the registry instance.
+    Reads are lock-free once the instance exists; only first-time construction is serialized,
+    so a worker thread racing the event loop cannot build (and auto-load drafts into) a second registry.
+    """
     global _registry_instance  # pylint: disable=global-statement  # module-level singleton
-    if _registry_instance is None:
-        _registry_instance = SimpleStateRegistry()
-    return _registry_instance
+    registry = _registry_instance
+    if registry is None:
+        with _registry_init_lock:
+            if _registry_instance is None:
+                _registry_instance = SimpleStateRegistry()
+            registry = _registry_instance
+    return registry
@@ -15,10 +15,14 @@
 # END COPYRIGHT
 from __future__ import annotations
 
+import io
 import json
 import logging
+import os
 import re
+import selectors
 import threading
+import time
 from datetime import datetime
 from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
@@ -34,6 +38,28 @@ from rich.syntax import Syntax
 from rich.text import Text
 from rich.theme import Theme
 
+from nsflow.backend.utils.tools.json_utils import json_dumps
+from nsflow.backend.utils.tools.json_utils import json_loads
+
+# (whole second since the epoch, "YYYY-MM-DD HH:MM:SS TZ") of the last _local_time_str call
+_time_str_cache: Tuple[int, str] = (0, "")
+
+
+def _local_time_str(timestamp: float) -> str:
+    """
+    Format a timestamp as local time with its zone name, at one-second resolution.
+    Records within the same second reuse one string, so the zone lookup and strftime
+    run once per second rather than once per line; DST changes are still picked up.
+    """
+    global _time_str_cache  # pylint: disable=global-statement  # module-level formatting cache
+    second = int(timestamp)
+    cached = _time_str_cache
+    if cached[0] != second:
+        dt = datetime.fromtimestamp(second).astimezone()
+        cached = (second, f"{dt.strftime('%Y-%m-%d %H:%M:%S')} {dt.tzname()}")
+        _time_str_cache = cached
+    return cached[1]
+
 
 # pylint: disable=too-many-instance-attributes,too-few-public-methods  # cohesive log-bridge with rich internal state
 class ProcessLogBridge:
@@ -49,6 +75,16 @@ class ProcessLogBridge:
 
     # ---------- constants ----------
     _LEVEL_WORD = re.compile(r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL|FATAL)\b", re.IGNORECASE)
+    # One pass finds either the first level word or a traceback marker, without lowercasing the line
+    _LEVEL_OR_TRACEBACK = re.compile(r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL|FATAL)\b|(traceback)", re.IGNORECASE)
+    _WORD_TO_LEVEL: Dict[str, int] = {
+        "DEBUG": logging.DEBUG,
+        "INFO": logging.INFO,
+        "WARNING": logging.WARNING,
+        "ERROR": logging.ERROR,
+        "CRITICAL": logging.CRITICAL,
+        "FATAL": logging.CRITICAL,
+    }
     _MESSAGE_TYPE_TO_LEVEL: Dict[str, int] = {
         "trace": logging.DEBUG,
         "debug": logging.DEBUG,
@@ -62,12 +98,21 @@ class ProcessLogBridge:
         "fatal": logging.CRITICAL,
     }
 
+    # Characters a JSON document can start with (after whitespace); anything else can skip the strict parse
+    _JSON_VALUE_START = re.compile(r'\s*[{\["\-0-9tfn]')
+
+    _TRAILING_COMMA = re.compile(r",\s*(?=[}\]])")
+    _BLANK_LINE_RUN = re.compile(r"\n{3,}")
+
     _TB_START = "Traceback (most recent call last):"
+    _TB_FILE_LINE = re.compile(r'File ".*?", line \d+(?:, in .*)?')
     _TB_CHAIN_1 = "During handling of the above exception, another exception occurred:"
     _TB_CHAIN_2 = "The above exception was the direct cause of the following exception:"
     _REQUEST_REPORTING_INNER = re.compile(r'Request reporting:\s*\{(?P<inner>.*?)\}\s*",', re.IGNORECASE | re.DOTALL)
     _META_FIELDS = ["user_id", "Timestamp", "source", "message_type", "request_id"]
-    _META_REGEXES = {f: re.compile(rf'"{f}"\s*:\s*"(?P<val>[^"]*)"', re.IGNORECASE) for f in _META_FIELDS}
+    # One scan picks up every meta field; group 1 is the field name as written in the block
+    _META_UNION = re.compile(rf'"({"|".join(_META_FIELDS)})"\s*:\s*"([^"]*)"', re.IGNORECASE)
+    _META_FIELD_BY_LOWER = {f.lower(): f for f in _META_FIELDS}
 
     # ---------- construction ----------
     def __init__(
@@ -135,22 +180,36 @@ class ProcessLogBridge:
         self._logger.info("Runner logging initialized (rich console enabled)")
 
         # Per-stream state: (process_name, stream_tag) -> state
-        # state keys: tee(TextIO), buffer(list[str]), balance(int), collecting(bool), logger(logging.Logger)
+        # state keys: tee(TextIO), buffer(io.StringIO), balance(int), collecting(bool), logger(logging.Logger)
         self._streams: Dict[Tuple[str, str], Dict[str, Any]] = {}
 
+        # POSIX: one selector thread drains every attached pipe (see _drain_selected)
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._selector_lock = threading.Lock()
+        self._selector_thread: Optional[threading.Thread] = None
+
     # ---------- public API ----------
     def attach_process_logger(self, process, process_name: str, log_file: str) -> None:
         """
-        Drain stdout/stderr in background threads, pretty-print to terminal, mirror raw to file.
+        Drain stdout/stderr in the background, pretty-print to terminal, mirror raw to file.
+        On POSIX all pipes share a single selector thread; on Windows, where pipes
+        cannot be selected on, each pipe gets its own drain thread.
         """
         Path(log_file).parent.mkdir(parents=True, exist_ok=True)
         # These tee handles are deliberately kept open for the process lifetime and
-        # closed when the drain threads finish, so a `with` block is not applicable.
+        # closed when the pipes hit EOF, so a `with` block is not applicable.
         tee_out = open(log_file, "a", encoding="utf-8")  # pylint: disable=consider-using-with
         tee_err = open(log_file, "a", encoding="utf-8")  # pylint: disable=consider-using-with
         self._streams[(process_name, "STDOUT")] = self._make_stream_state(process_name, tee_out)
         self._streams[(process_name, "STDERR")] = self._make_stream_state(process_name, tee_err)
 
+        if os.name != "nt":
+            self._select_pipes(
+                (process.stdout, self._streams[(process_name, "STDOUT")]),
+                (process.stderr, self._streams[(process_name, "STDERR")]),
+            )
+            return
+
         t_out = threading.Thread(target=self._drain_pipe, args=(process.stdout, process_name, "STDOUT"), daemon=True)
         t_err = threading.Thread(target=self._drain_pipe, args=(process.stderr, process_name, "STDERR"), daemon=True)
         t_out.start()
@@ -162,19 +221,17 @@ class ProcessLogBridge:
         return datetime.now().astimezone()
 
     def _rich_time_text(self, record=None, date=None):  # pylint: disable=unused-argument  # Rich time-formatter callback signature
-        now = self._now_local()
-        return Text(f"[{now.strftime('%Y-%m-%d %H:%M:%S')} {now.tzname()}]", style=self._time_style_key)
+        return Text(f"[{_local_time_str(time.time())}]", style=self._time_style_key)
 
     class _TZFormatter(logging.Formatter):
         def formatTime(self, record, datefmt=None):
-            dt = datetime.fromtimestamp(record.created).astimezone()
-            return f"{dt.strftime('%Y-%m-%d %H:%M:%S')} {dt.tzname()}"
+            return _local_time_str(record.created)
 
     # ---------- helpers: per-stream state ----------
     def _make_stream_state(self, process_name: str, tee: TextIO) -> Dict[str, Any]:
         return {
             "tee": tee,
-            "buffer": [],
+            "buffer": io.StringIO(),
             "balance": 0,
             "collecting": False,
             "logger": logging.getLogger(process_name),
@@ -209,15 +266,76 @@ class ProcessLogBridge:
                 pass
             self._close_stream(state)
 
+    def _select_pipes(self, *pipes_and_states: Tuple[Any, Dict[str, Any]]) -> None:
+        """Register pipes with the shared selector, starting its drain thread if it is not running"""
+        with self._selector_lock:
+            if self._selector is None:
+                self._selector = selectors.DefaultSelector()
+            for pipe, state in pipes_and_states:
+                # data: (stream state, pending bytes of an unterminated line)
+                self._selector.register(pipe, selectors.EVENT_READ, (state, bytearray()))
+            if self._selector_thread is None:
+                self._selector_thread = threading.Thread(target=self._drain_selected, daemon=True)
+                self._selector_thread.start()
+
+    def _drain_selected(self) -> None:
+        """Read every registered pipe as it becomes readable; exits once no pipes are left"""
+        selector = self._selector
+        while True:
+            with self._selector_lock:
+                if not selector.get_map():
+                    self._selector_thread = None
+                    return
+            for key, _ in selector.select(timeout=0.1):
+                state, pending = key.data
+                try:
+                    chunk = os.read(key.fd, 65536)
+                except OSError:
+                    chunk = b""
+                if chunk:
+                    pending += chunk
+                    end = pending.rfind(b"\n")
+                    if end != -1:
+                        # Decode every complete line of this read at once; \n never splits a UTF-8 sequence
+                        block = pending[:end].decode("utf-8", errors="replace")
+                        del pending[: end + 1]
+                        self._handle_selected_lines(state, block)
+                    continue
+
+                # EOF: like readline, hand over a trailing line without a newline, then close
+                if pending:
+                    self._handle_selected_lines(state, pending.decode("utf-8", errors="replace"))
+                with self._selector_lock:
+                    selector.unregister(key.fileobj)
+                try:
+                    key.fileobj.close()
+                except Exception:
+                    pass
+                self._close_stream(state)
+
+    def _handle_selected_lines(self, state: Dict[str, Any], block: str) -> None:
+        # Match the text-mode pipes used by the thread drain: universal newlines end a line at \n, \r\n or a lone \r
+        if "\r" in block:
+            # A trailing \r is the first half of the \r\n the block was cut at (or ends the output at EOF)
+            block = block.removesuffix("\r").replace("\r\n", "\n").replace("\r", "\n")
+        lines = block.split("\n")
+        # Mirror the whole read to the tee with one write instead of one per line
+        self._write_tee(state, "\n".join(lines))
+        for line in lines:
+            try:
+                self._handle_line(state, line, tee=False)
+            except Exception as e:
+                # The drain thread is shared, so one bad line must not stop the other pipes
+                self._logger.error("Failed to handle output line of %s: %s", state["logger"].name, e)
+
     # ---------- line handling ----------
-    def _handle_line(self, state: Dict[str, Any], line: str) -> None:
-        if line == "":
+    def _handle_line(self, state: Dict[str, Any], line: str, tee: bool = True) -> None:
+        # Mirror raw first (unless the caller already wrote the line to the tee)
+        if tee:
             self._write_tee(state, line)
+        if line == "":
             return
 
-        # Mirror raw first
-        self._write_tee(state, line)
-
         # Single-line JSON?
         obj = self._try_parse_json_fragment(line)
         if obj is not None:
@@ -244,6 +362,11 @@ class ProcessLogBridge:
     # ---------- reassembler (stateful, no extra classes) ----------
     @staticmethod
     def _count_braces_outside_quotes(s: str) -> int:
+        if "\\" not in s:
+            # Without escapes every quote toggles the string state, so the even
+            # segments between quotes are exactly the text outside strings
+            # and str.count can do the scanning in C
+            return sum(seg.count("{") - seg.count("}") for seg in s.split('"')[::2])
         depth = 0
         in_str = False
         esc = False
@@ -267,14 +390,19 @@ class ProcessLogBridge:
 
     def _reasm_start_if_jsonish(self, state: Dict[str, Any], line: str) -> bool:
         if "{" in line:
-            state["buffer"] = [line]
+            buf = state["buffer"]
+            buf.seek(0)
+            buf.truncate()
+            buf.write(line)
+            buf.write("\n")
             state["balance"] = self._count_braces_outside_quotes(line)
             state["collecting"] = True
             return True
         return False
 
     def _reasm_add(self, state: Dict[str, Any], line: str) -> None:
-        state["buffer"].append(line)
+        state["buffer"].write(line)
+        state["buffer"].write("\n")
         state["balance"] += self._count_braces_outside_quotes(line)
 
     @staticmethod
@@ -287,8 +415,10 @@ class ProcessLogBridge:
 
     @staticmethod
     def _reasm_flush(state: Dict[str, Any]) -> str:
-        text = "\n".join(state["buffer"]).strip()
-        state["buffer"].clear()
+        buf = state["buffer"]
+        text = buf.getvalue().strip()
+        buf.seek(0)
+        buf.truncate()
         state["balance"] = 0
         state["collecting"] = False
         return text
@@ -301,69 +431,73 @@ class ProcessLogBridge:
     def _infer_level_from_text(self, line: str, default: int = logging.INFO) -> int:
         if not line:
             return default
-        m = self._LEVEL_WORD.search(line)
+        m = self._LEVEL_OR_TRACEBACK.search(line)
         if not m:
-            if "traceback" in line.lower():
-                return logging.ERROR
             return default
-        word = m.group(1).upper()
-        return logging.CRITICAL if word == "FATAL" else getattr(logging, word, default)
+        if m.group(1) is None:
+            # A level word anywhere still wins over the traceback marker
+            m = self._LEVEL_WORD.search(line, m.end())
+            if not m:
+                return logging.ERROR
+        return self._WORD_TO_LEVEL.get(m.group(1).upper(), default)
 
     # ---------- json helpers ----------
     @staticmethod
     def _pretty_json(obj: Any) -> str:
         try:
-            return json.dumps(obj, indent=2, ensure_ascii=False)
+            return json_dumps(obj, indent=True)
         except Exception:
             return str(obj)
 
-    @staticmethod
-    def _try_parse_json_fragment(text: str) -> Optional[Dict[str, Any]]:
+    @classmethod
+    def _try_parse_json_fragment(cls, text: str) -> Optional[Dict[str, Any]]:
         if not text:
             return None
-        # strict
-        try:
-            obj = json.loads(text)
-            return obj if isinstance(obj, dict) else {"message": obj}
-        except Exception:
-            pass
+        # strict, unless the line cannot be a JSON document (most plain log lines)
+        if cls._JSON_VALUE_START.match(text):
+            try:
+                obj = json_loads(text)
+                return obj if isinstance(obj, dict) else {"message": obj}
+            except Exception:
+                pass
         # first {...}
         s = text.find("{")
         e = text.rfind("}")
         if s != -1 and e != -1 and e > s:
             frag = text[s : e + 1]
             try:
-                obj = json.loads(frag)
+                obj = json_loads(frag)
                 return obj if isinstance(obj, dict) else {"message": obj}
             except Exception:
                 return None
         return None
 
-    @staticmethod
-    def _lenient_inner_json_parse(val: Any) -> Optional[Any]:
+    @classmethod
+    def _lenient_inner_json_parse(cls, val: Any) -> Optional[Any]:
         if not isinstance(val, str):
             return None
         s = val.strip()
-        if not s:
-            return None
-        if not (s.lstrip().startswith("{") or s.lstrip().startswith("[")):
+        if not s or s[0] not in "{[":
             return None
         # strict
         try:
-            return json.loads(s)
+            return json_loads(s)
         except Exception:
             pass
         # mild cleanup: unescape \n \t \r and drop trailing commas
         s2 = s.replace("\\r", "\r").replace("\\t", "\t").replace("\\n", "\n")
-        s2 = re.sub(r",\s*(?=[}\]])", "", s2)
-        s2 = re.sub(r"\n{3,}", "\n\n", s2)
+        s2 = cls._TRAILING_COMMA.sub("", s2)
+        s2 = cls._BLANK_LINE_RUN.sub("\n\n", s2)
         try:
-            return json.loads(s2)
+            return json_loads(s2)
         except Exception:
             return None
 
     # ---------- special NeuroSan block ----------
     def _rebuild_neurosan_request_reporting(self, text_block: str) -> Optional[Dict[str, Any]]:
+        # Cheap substring gate before the DOTALL regex, which is case-insensitive too
+        if "request reporting:" not in text_block.lower():
+            return None
         m = self._REQUEST_REPORTING_INNER.search(text_block)
         if not m:
             return None
@@ -373,10 +507,11 @@ class ProcessLogBridge:
         except Exception:
             inner = inner_src
         out: Dict[str, Any] = {"message": inner}
-        for f, rx in self._META_REGEXES.items():
-            mm = rx.search(text_block)
-            if mm:
-                out[f] = mm.group("val")
+        for mm in self._META_UNION.finditer(text_block):
+            # The first occurrence of each field wins, as with a per-field search
+            field = self._META_FIELD_BY_LOWER[mm.group(1).lower()]
+            if field not in out:
+                out[field] = mm.group(2)
         out.setdefault("Timestamp", self._now_local().isoformat())
         out.setdefault("source", "HttpServer")
         out.setdefault("message_type", "Other")
@@ -400,13 +535,13 @@ class ProcessLogBridge:
             ("Error:", "\nError:"),
         ]:
             message = message.replace(old, new)
-        message = re.sub(r"\n{3,}", "\n\n", message)
+        message = self._BLANK_LINE_RUN.sub("\n\n", message)
         return message.strip()
 
     def _looks_like_traceback(self, s: str) -> bool:
         if self._TB_START in (s or ""):
             return True
-        return bool(re.search(r'File ".*?", line \d+(?:, in .*)?', s or ""))
+        return bool(self._TB_FILE_LINE.search(s or ""))
 
     # ---------- emitters ----------
     def _src_header(self, process_name: str, source: Optional[str]) -> str:
@@ -414,21 +549,26 @@ class ProcessLogBridge:
 
     def _emit_json_block(self, state: Dict[str, Any], record: Dict[str, Any]) -> None:
         level = self._infer_level_from_message_type(record)
+        # Nothing below is worth building (inner JSON parse, pretty print) for a filtered-out record
+        if not state["logger"].isEnabledFor(level):
+            return
         src = str(record.get("source") or "").strip() or None
         header = self._src_header(state["logger"].name, src)
 
-        # Display copy
-        display_rec = dict(record)
-        inner = self._lenient_inner_json_parse(display_rec.get("message"))
+        # Display copy, only needed when the message itself holds JSON
+        msg = record.get("message")
+        display_rec = record
+        inner = self._lenient_inner_json_parse(msg)
         if inner is not None:
+            display_rec = dict(record)
             display_rec["message"] = inner
 
         body = self._pretty_json(display_rec)
         self._log(state, level, header + "\n" + body)
 
-        # If message was traceback-like text, pretty print after
-        msg = record.get("message")
-        if isinstance(msg, str):
+        # If message was traceback-like text, pretty print after.
+        # Normalizing never introduces either marker, so plain messages skip it.
+        if isinstance(msg, str) and ("File " in msg or self._TB_START in msg):
             tb_text = self._normalize_traceback_str(msg)
             if self._looks_like_traceback(tb_text):
                 self._log(state, level, header + " (traceback)")
@@ -456,14 +596,5 @@ class ProcessLogBridge:
     # ---------- logging wrapper ----------
     @staticmethod
     def _log(state: Dict[str, Any], level: int, msg: str) -> None:
-        lg = state["logger"]
-        if level >= logging.CRITICAL:
-            lg.critical(msg)
-        elif level >= logging.ERROR:
-            lg.error(msg)
-        elif level >= logging.WARNING:
-            lg.warning(msg)
-        elif level >= logging.INFO:
-            lg.info(msg)
-        else:
-            lg.debug(msg)
+        # Levels come from the level tables above, so they are always standard logging levels
+        state["logger"].log(level, msg)
@@ -26,17 +26,30 @@ throughout the application via a shared registry.
 import asyncio
 import json
 import logging
+import time
+from collections import deque
 from datetime import datetime
 from datetime import timezone
 from typing import Any
+from typing import Deque
 from typing import Dict
-from typing import List
+from typing import Tuple
 
 from fastapi import WebSocket
 from fastapi import WebSocketDisconnect
 
+from nsflow.backend.utils.tools.json_utils import json_dumps
+
 # Configuration
-ASYNCIO_SLEEP_INTERVAL = 0.5
+# Max pending messages per client; a client that falls further behind loses its oldest messages
+SUBSCRIBER_QUEUE_SIZE = 1024
+
+# A connected client and the queue its handler drains
+Subscriber = Tuple[WebSocket, asyncio.Queue]
+
+
+# (whole UTC second since the epoch, "YYYY-MM-DD HH:MM:SS") of the last get_timestamp call
+_timestamp_cache: Tuple[int, str] = (0, "")
 
 
 class WebsocketLogsManager:  # pylint: disable=too-many-instance-attributes  # aggregates per-connection log state
@@ -45,6 +58,9 @@ class WebsocketLogsManager:  # pylint: disable=too-many-instance-attributes  # a
     Each instance manages a list of connected WebSocket clients and can broadcast messages
     to clients in real-time. Supports both general logs and internal chat streams.
     Scoped per agent and session to ensure multi-user isolation.
+
+    Connection lists are immutable tuples replaced wholesale on connect/disconnect, and
+    every client has its own queue, so a broadcast never waits on a slow client.
     """
 
     LOG_BUFFER_SIZE = 100
@@ -57,19 +73,26 @@ class WebsocketLogsManager:  # pylint: disable=too-many-instance-attributes  # a
         """
         self.agent_name = agent_name
         self.session_id = session_id
-        self.active_log_connections: List[WebSocket] = []
-        self.active_internal_chat_connections: List[WebSocket] = []
-        self.active_sly_data_connections: List[WebSocket] = []
-        self.active_progress_connections: List[WebSocket] = []
+        self.active_log_connections: Tuple[Subscriber, ...] = ()
+        self.active_internal_chat_connections: Tuple[Subscriber, ...] = ()
+        self.active_sly_data_connections: Tuple[Subscriber, ...] = ()
+        self.active_progress_connections: Tuple[Subscriber, ...] = ()
         self.logger = logging.getLogger(f"{self.agent_name}")
-        self.log_buffer: List[Dict] = []
+        self.log_buffer: Deque[Dict] = deque(maxlen=self.LOG_BUFFER_SIZE)
 
     def get_timestamp(self):
         """
         Get the current UTC timestamp formatted as a string.
+        Log events within the same second share one cached string.
         :return: A timestamp string in 'YYYY-MM-DD HH:MM:SS' format.
         """
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        global _timestamp_cache  # pylint: disable=global-statement  # module-level formatting cache
+        second = int(time.time())
+        cached = _timestamp_cache
+        if cached[0] != second:
+            cached = (second, datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%d %H:%M:%S"))
+            _timestamp_cache = cached
+        return cached[1]
 
     async def log_event(self, message: str, source: str = "neuro-san"):
         """
@@ -87,9 +110,8 @@ class WebsocketLogsManager:  # pylint: disable=too-many-instance-attributes  # a
         # Log the message
         if "token_accounting" not in message:
             self.logger.info(message)
+        # Bounded deque: the oldest entry is evicted once LOG_BUFFER_SIZE is reached
         self.log_buffer.append(log_entry)
-        if len(self.log_buffer) > self.LOG_BUFFER_SIZE:
-            self.log_buffer.pop(0)
         # Broadcast to connected clients
         await self.broadcast_to_websocket(log_entry, self.active_log_connections)
 
@@ -120,20 +142,75 @@ class WebsocketLogsManager:  # pylint: disable=too-many-instance-attributes  # a
         self.logger.debug(message)
         await self.broadcast_to_websocket(entry, self.active_sly_data_connections)
 
-    async def broadcast_to_websocket(self, entry: Dict[str, Any], connections_list: List[WebSocket]):
+    async def broadcast_to_websocket(self, entry: Dict[str, Any], connections_list: Tuple[Subscriber, ...]):
         """
-        Broadcast a message to a list of WebSocket clients, removing any disconnected ones.
+        Queue a message for every subscribed WebSocket client.
+        The entry is serialized once and the same payload is shared by all clients.
+        Each client's handler sends from its own queue; if a client's queue is full,
+        its oldest pending message is dropped.
         :param entry: The dictionary message to send (will be JSON serialized).
-        :param connections_list: List of currently active WebSocket clients.
+        :param connections_list: Snapshot of currently active WebSocket clients.
+        """
+        if not connections_list:
+            return
+        payload = json_dumps(entry)
+        for _, queue in connections_list:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(payload)
+
+    def _subscribe(self, channel: str, websocket: WebSocket) -> asyncio.Queue:
+        """
+        Add a client to a connection list (by attribute name) and return its queue.
+        :param channel: Name of the connection list attribute, e.g. "active_log_connections".
+        :param websocket: The connected WebSocket instance.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        setattr(self, channel, getattr(self, channel) + ((websocket, queue),))
+        return queue
+
+    def _unsubscribe(self, channel: str, websocket: WebSocket):
+        """
+        Remove a client from a connection list (by attribute name).
+        :param channel: Name of the connection list attribute, e.g. "active_log_connections".
+        :param websocket: The WebSocket instance to remove.
         """
-        disconnected: List[WebSocket] = []
-        for ws in connections_list:
-            try:
-                await ws.send_text(json.dumps(entry))
-            except WebSocketDisconnect:
-                disconnected.append(ws)
-        for ws in disconnected:
-            connections_list.remove(ws)
+        setattr(self, channel, tuple(sub for sub in getattr(self, channel) if sub[0] is not websocket))
+
+    @classmethod
+    async def _send_queued(cls, websocket: WebSocket, queue: asyncio.Queue):
+        """
+        Send a client's queued messages until it disconnects.
+        A receive waiter runs alongside the sender, so a client that closes while the
+        channel is idle is noticed immediately rather than on the next failed send.
+        :param websocket: The connected WebSocket instance.
+        :param queue: The client's queue of serialized payloads, filled by broadcast_to_websocket.
+        """
+        sender = asyncio.create_task(cls._send_forever(websocket, queue))
+        receiver = asyncio.create_task(cls._wait_for_disconnect(websocket))
+        try:
+            done, _ = await asyncio.wait((sender, receiver), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            sender.cancel()
+            receiver.cancel()
+        for task in done:
+            # Surfaces WebSocketDisconnect/RuntimeError to the handler
+            task.result()
+
+    @staticmethod
+    async def _send_forever(websocket: WebSocket, queue: asyncio.Queue):
+        """Send queued payloads to the client, one at a time."""
+        while True:
+            payload = await queue.get()
+            await websocket.send_text(payload)
+
+    @staticmethod
+    async def _wait_for_disconnect(websocket: WebSocket):
+        """Discard anything the client sends and return once it disconnects."""
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
 
     async def handle_internal_chat_websocket(self, websocket: WebSocket):
         """
@@ -141,14 +218,16 @@ class WebsocketLogsManager:  # pylint: disable=too-many-instance-attributes  # a
         :param websocket: The connected WebSocket instance.
         """
         await websocket.accept()
-        self.active_internal_chat_connections.append(websocket)
+        queue = self._subscribe("active_internal_chat_connections", websocket)
         await self.internal_chat_event(f"Internal chat connected: {self.agent_name}")
         try:
-            while True:
-                await asyncio.sleep(1)
-        except WebSocketDisconnect:
-            self.active_internal_chat_connections.remove(websocket)
-            await self.internal_chat_event(f"Internal chat disconnected: {self.agent_name}")
+            await self._send_queued(websocket, queue)
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+        finally:
+            # Also runs on cancellation, so a dropped handler never leaves its queue subscribed
+            self._unsubscribe("active_internal_chat_connections", websocket)
+        await self.internal_chat_event(f"Internal chat disconnected: {self.agent_name}")
 
     async def handle_log_websocket(self, websocket: WebSocket):
         """
@@ -156,14 +235,15 @@ class WebsocketLogsManager:  # pylint: disable=too-many-instance-attributes  # a
         :param websocket: The connected WebSocket instance.
         """
         await websocket.accept()
-        self.active_log_connections.append(websocket)
+        queue = self._subscribe("active_log_connections", websocket)
         await self.log_event("New logs client connected", "FastAPI")
         try:
-            while True:
-                await asyncio.sleep(2)
-        except WebSocketDisconnect:
-            self.active_log_connections.remove(websocket)
-            await self.log_event("Logs client disconnected", "FastAPI")
+            await self._send_queued(websocket, queue)
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+        finally:
+            self._unsubscribe("active_log_connections", websocket)
+        await self.log_event("Logs client disconnected", "FastAPI")
 
     async def handle_sly_data_websocket(self, websocket: WebSocket):
         """
@@ -171,14 +251,15 @@ class WebsocketLogsManager:  # pylint: disable=too-many-instance-attributes  # a
         :param websocket: The connected WebSocket instance.
         """
         await websocket.accept()
-        self.active_sly_data_connections.append(websocket)
+        queue = self._subscribe("active_sly_data_connections", websocket)
         await self.sly_data_event(f"Sly Data connected: {self.agent_name}")
         try:
-            while True:
-                await asyncio.sleep(3)
-        except WebSocketDisconnect:
-            self.active_sly_data_connections.remove(websocket)
-            await self.sly_data_event(f"Sly Data disconnected: {self.agent_name}")
+            await self._send_queued(websocket, queue)
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+        finally:
+            self._unsubscribe("active_sly_data_connections", websocket)
+        await self.sly_data_event(f"Sly Data disconnected: {self.agent_name}")
 
     async def handle_progress_websocket(self, websocket: WebSocket):
         """
@@ -186,15 +267,16 @@ class WebsocketLogsManager:  # pylint: disable=too-many-instance-attributes  # a
         :param websocket: The connected WebSocket instance.
         """
         await websocket.accept()
-        self.active_progress_connections.append(websocket)
+        queue = self._subscribe("active_progress_connections", websocket)
         await self.progress_event(
             {"text": json.dumps({"event": "progress_client_connected", "agent": self.agent_name})}
         )
         try:
-            while True:
-                await asyncio.sleep(ASYNCIO_SLEEP_INTERVAL)
-        except WebSocketDisconnect:
-            self.active_progress_connections.remove(websocket)
-            await self.progress_event(
-                {"text": json.dumps({"event": "progress_client_connected", "agent": self.agent_name})}
-            )
+            await self._send_queued(websocket, queue)
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+        finally:
+            self._unsubscribe("active_progress_connections", websocket)
+        await self.progress_event(
+            {"text": json.dumps({"event": "progress_client_connected", "agent": self.agent_name})}
+        )
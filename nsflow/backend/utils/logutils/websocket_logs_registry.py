@@ -21,6 +21,7 @@ This allows consistent reuse of log managers across different components
 """
 
 from typing import Dict
+from typing import Tuple
 
 from nsflow.backend.utils.logutils.websocket_logs_manager import WebsocketLogsManager
 
@@ -33,7 +34,7 @@ class LogsRegistry:
     ensuring isolated broadcasting of logs and internal chat messages per user session.
     """
 
-    _managers: Dict[str, WebsocketLogsManager] = {}
+    _managers: Dict[Tuple[str, str], WebsocketLogsManager] = {}
 
     @classmethod
     def register(cls, agent_name: str = "global", session_id: str = "global") -> WebsocketLogsManager:
@@ -50,7 +51,9 @@ class LogsRegistry:
                           Defaults to "global" for backward compatibility.
         :return: A WebsocketLogsManager instance tied to the given agent_name:session_id pair.
         """
-        key = f"{agent_name}:{session_id}"
-        if key not in cls._managers:
-            cls._managers[key] = WebsocketLogsManager(agent_name, session_id)
-        return cls._managers[key]
+        key = (agent_name, session_id)
+        manager = cls._managers.get(key)
+        if manager is None:
+            # setdefault is atomic, so concurrent first registrations still share one manager
+            manager = cls._managers.setdefault(key, WebsocketLogsManager(agent_name, session_id))
+        return manager
@@ -0,0 +1,53 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+JSON helpers backed by orjson, with the stdlib json module covering what orjson rejects or would misread.
+"""
+
+import json
+import re
+from typing import Any
+
+import orjson
+
+# A run of 20+ digits may be an integer wider than 64 bits, which orjson silently reads as a float
+_LONG_DIGIT_RUN = re.compile(r"\d{20}")
+
+
+def json_loads(text: str) -> Any:
+    """Parse JSON with orjson, falling back to the stdlib for what orjson rejects or would misread"""
+    if not _LONG_DIGIT_RUN.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # e.g. NaN, Infinity or out-of-range floats, which json.loads accepts
+            pass
+    return json.loads(text)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize obj to JSON text with orjson; values it refuses (e.g. non-string keys, ints wider
+    than 64 bits) go through json.dumps. indent pretty-prints with two spaces.
+    """
+    try:
+        if indent:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        return orjson.dumps(obj).decode("utf-8")
+    except TypeError:
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False)
+        return json.dumps(obj)
@@ -17,6 +17,8 @@
 from collections import deque
 
 from graphviz import Graph
+from graphviz.quoting import quote
+from graphviz.quoting import quote_edge
 
 
 # pylint: disable=too-few-public-methods
@@ -84,29 +86,29 @@ class NotebookUtils:
                              an "origin" and a "tools" list (representing downstream dependencies).
         :return: A `graphviz.Graph` object representing the agent network graph.
         """
-        coded_prefixes = self.config["coded_tool_classes"]
+        # str.startswith takes a tuple and checks every prefix in one call
+        coded_prefixes = tuple(self.config["coded_tool_classes"])
         graph_map = {
-            item["origin"]: [
-                tool for tool in item.get("tools", []) if not any(tool.startswith(prefix) for prefix in coded_prefixes)
-            ]
+            item["origin"]: [tool for tool in item.get("tools", []) if not tool.startswith(coded_prefixes)]
             for item in network_data["connectivity"]
-            if not any(item["origin"].startswith(prefix) for prefix in coded_prefixes)
+            if not item["origin"].startswith(coded_prefixes)
         }
 
-        # Assign levels using BFS
+        # Assign levels using BFS; node_levels doubles as the visited set, so every node
+        # is queued and expanded exactly once (O(V + E)) even when several parents share a child
         node_levels = {root_node_name: 0}
         queue = deque([root_node_name])
-        visited = set()
+        # Bound methods hoisted out of the per-edge loop
+        children_of = graph_map.get
+        enqueue = queue.append
 
         while queue:
             node = queue.popleft()
-            visited.add(node)
-            level = node_levels[node]
-            for child in graph_map.get(node, []):
+            level = node_levels[node] + 1
+            for child in children_of(node, ()):
                 if child not in node_levels:
-                    node_levels[child] = level + 1
-                if child not in visited:
-                    queue.append(child)
+                    node_levels[child] = level
+                    enqueue(child)
 
         # Create Graphviz graph
         graph_format = "png" if self.config.get("render_png") else "dot"
@@ -128,14 +130,24 @@ class NotebookUtils:
             height=self.config["node_height"],
         )
 
-        # Add nodes with level-specific colors
-        for node, level in node_levels.items():
-            color = self.config["level_colors"][min(level, len(self.config["level_colors"]) - 1)]
-            dot.node(node, fillcolor=color, style="filled")
-
-        # Add directed edges
+        # Write the node and edge statements straight into the graph body in one pass instead of
+        # going through dot.node()/dot.edge() per element; the lines match what those calls emit
+        level_colors = [quote(color) for color in self.config["level_colors"]]
+        max_level = len(level_colors) - 1
+        body = [
+            f"\t{quote(node)} [fillcolor={level_colors[min(level, max_level)]} style=filled]\n"
+            for node, level in node_levels.items()
+        ]
+        # Add edges; the graph is undirected, so a pair listed both ways (or twice) is drawn once,
+        # in the direction it was first seen, and self-loops are left out
+        seen_edges = set()
         for origin, tools in graph_map.items():
             for tool in tools:
-                dot.edge(origin, tool, arrowhead="normal")
+                key = (origin, tool) if origin < tool else (tool, origin)
+                if origin == tool or key in seen_edges:
+                    continue
+                seen_edges.add(key)
+                body.append(f"\t{quote_edge(origin)} -- {quote_edge(tool)} [arrowhead=normal]\n")
+        dot.body.extend(body)
 
         return dot
@@ -15,24 +15,26 @@
 # END COPYRIGHT
 
 from dataclasses import dataclass
+from dataclasses import field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NsConfig:
     """
     Class to manage configuration settings for the Neuro-San server.
     This class is responsible for storing and retrieving configuration
     parameters such as connectivity, host and port for the Neuro-San server.
+    Instances are immutable, so the url form is built once at construction.
     """
 
     host: str
     port: int
     connection_type: str = "http"
+    config_id: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def config_id(self) -> str:
-        """Return the url form of a config"""
-        return f"{self.connection_type}://{self.host}:{self.port}"
+    def __post_init__(self):
+        """Precompute the url form of a config"""
+        object.__setattr__(self, "config_id", f"{self.connection_type}://{self.host}:{self.port}")
 
     def to_dict(self):
         """Return the dict form of a config"""
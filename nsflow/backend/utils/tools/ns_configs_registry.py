@@ -62,6 +62,14 @@ class NsConfigsRegistry:
             raise RuntimeError("No current config is set.")
         return cls._configs[cls._current_config_id]
 
+    @classmethod
+    def require_current(cls) -> NsConfig:
+        """Get the current config, failing with a hint for endpoints used before /set_config"""
+        try:
+            return cls.get_current()
+        except RuntimeError as e:
+            raise RuntimeError("No active NsConfigStore. Please set it via /set_config before using endpoints.") from e
+
     @classmethod
     def set_current(cls, connection_type: str, host: str, port: int) -> NsConfig:
         """Set current connectivity"""
@@ -342,8 +342,12 @@ The type of connection to initiate. Choices are to connect to:
             str(self.config["nsflow_port"]),
             "--log-level",
             self.config["nsflow_log_level"],
-            "--reload",
         ]
+        # The reload file watcher only pays off while developing nsflow itself.
+        # uvicorn's default loop/http "auto" already picks uvloop and httptools when installed.
+        # A single worker is kept: logs managers, sessions and editor state live in this process.
+        if self.config["dev"]:
+            command.append("--reload")
 
         self.fastapi_process = self.start_process(
             command, "FastAPI", os.path.join(self.config["nsflow_log_dir"], "api.log")
@@ -0,0 +1,79 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+import asyncio
+import unittest
+
+from neuro_san.message.types.chat_message_type import ChatMessageType
+
+from nsflow.backend.utils.agentutils.agent_log_processor import AgentLogProcessor
+
+
+class _RecordingLogsManager:
+    """Stand-in for WebsocketLogsManager that records what would be broadcast."""
+
+    def __init__(self):
+        self.log_events = []
+        self.internal_chats = []
+
+    async def log_event(self, message, source="neuro-san"):  # pylint: disable=unused-argument  # mirrors log_event
+        """Record a log event."""
+        self.log_events.append(message)
+
+    async def internal_chat_event(self, message):
+        """Record an internal chat event."""
+        self.internal_chats.append(message)
+
+    async def progress_event(self, message):
+        """Progress events are not under test."""
+
+
+def _agent_message(tool: str, text: str):
+    return {"text": text, "origin": [{"tool": tool}]}
+
+
+class TestAgentLogProcessor(unittest.TestCase):
+    def test_repeated_events_are_sent_once(self):
+        """A frame repeating the last one is dropped; the same frame after a different one is sent again."""
+        processor = AgentLogProcessor("net", "session-1")
+        logs_manager = processor.logs_manager = _RecordingLogsManager()
+        messages = [
+            _agent_message("front", "hello"),
+            _agent_message("front", "hello"),
+            _agent_message("helper", "working"),
+            _agent_message("front", "hello"),
+        ]
+
+        async def run():
+            for message in messages:
+                await processor.async_process_message(message, ChatMessageType.AGENT)
+
+        asyncio.run(run())
+
+        self.assertEqual(
+            logs_manager.log_events, ['{"otrace": ["front"]}', '{"otrace": ["helper"]}', '{"otrace": ["front"]}']
+        )
+        self.assertEqual(
+            logs_manager.internal_chats,
+            [
+                {"otrace": ["front"], "text": "hello"},
+                {"otrace": ["helper"], "text": "working"},
+                {"otrace": ["front"], "text": "hello"},
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
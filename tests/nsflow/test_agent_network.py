@@ -21,16 +21,24 @@ from nsflow.backend.utils.agentutils.agent_network_utils import AgentNetworkUtil
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.dirname(THIS_DIR)
 FIXTURES_DIR = os.path.join(ROOT_DIR, "fixtures")
+TEST_HOCON_PATH = os.path.join(FIXTURES_DIR, "test_network.hocon")
 
 
 class TestAgentNetwork(unittest.TestCase):
-    def setUp(self):
-        """Setup test instance."""
-        self.agent_utils = AgentNetworkUtils()
-        self.test_hocon_path = os.path.join(FIXTURES_DIR, "test_network.hocon")
+    # Show full diff, no truncation
+    # maxDiff = None
 
-        # Show full diff, no truncation
-        # self.maxDiff = None
+    @classmethod
+    def setUpClass(cls):
+        """Set up the shared test instance once for the class."""
+        cls.agent_utils = AgentNetworkUtils()
+        cls.test_hocon_path = TEST_HOCON_PATH
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release the shared test instance."""
+        cls.agent_utils = None
+        cls.test_hocon_path = None
 
     def test_extract_connectivity_info(self):
         """Test extracting connectivity info from an HOCON network file."""
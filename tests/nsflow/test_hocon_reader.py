@@ -0,0 +1,58 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+import os
+import shutil
+import tempfile
+import unittest
+
+from nsflow.backend.utils.editor.hocon_reader import _hocon_file_mtimes
+from nsflow.backend.utils.editor.hocon_reader import _restore_hocon_file
+
+
+class TestHoconReaderCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.main_file = os.path.join(self.tmp_dir, "main.hocon")
+        self.include_file = os.path.join(self.tmp_dir, "shared.hocon")
+        self._write(self.main_file, f'include "{self.include_file}"\nname = "main"\n', 1)
+        self._write(self.include_file, 'llm_config { model_name = "a" }\n', 1)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _write(path: str, text: str, mtime: int):
+        """Write text and pin the mtime so cache keys don't depend on filesystem timestamp resolution."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.utime(path, ns=(mtime, mtime))
+
+    def _read(self):
+        return _restore_hocon_file(self.main_file, _hocon_file_mtimes(self.main_file))
+
+    def test_mtimes_cover_included_files(self):
+        """The cache key lists the top-level file and everything it includes."""
+        self.assertEqual(_hocon_file_mtimes(self.main_file), ((self.main_file, 1), (self.include_file, 1)))
+
+    def test_edited_include_is_parsed_again(self):
+        """Editing only an included file must not return the stale cached parse."""
+        self.assertEqual(self._read()["llm_config"]["model_name"], "a")
+        self._write(self.include_file, 'llm_config { model_name = "b" }\n', 2)
+        self.assertEqual(self._read()["llm_config"]["model_name"], "b")
+
+
+if __name__ == "__main__":
+    unittest.main()
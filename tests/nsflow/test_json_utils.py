@@ -0,0 +1,45 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+import json
+import math
+import unittest
+
+from nsflow.backend.utils.tools.json_utils import json_dumps
+from nsflow.backend.utils.tools.json_utils import json_loads
+
+
+class TestJsonUtils(unittest.TestCase):
+    def test_loads_accepts_what_the_stdlib_accepts(self):
+        """NaN/Infinity and integers wider than 64 bits parse the same as with json.loads."""
+        parsed = json_loads('{"a": NaN, "b": -Infinity, "id": 18446744073709551616}')
+        self.assertTrue(math.isnan(parsed["a"]))
+        self.assertEqual(parsed["b"], -math.inf)
+        self.assertEqual(parsed["id"], 18446744073709551616)
+
+    def test_loads_still_rejects_invalid_json(self):
+        """Text neither parser accepts raises the stdlib's JSONDecodeError."""
+        with self.assertRaises(json.JSONDecodeError):
+            json_loads("{not json")
+
+    def test_dumps_falls_back_for_values_orjson_refuses(self):
+        """Non-string keys and wide integers still serialize, through the stdlib encoder."""
+        self.assertEqual(json_loads(json_dumps({"a": [1, "b"]})), {"a": [1, "b"]})
+        self.assertEqual(json_dumps({1: 2**70}), json.dumps({1: 2**70}))
+        self.assertEqual(json_loads(json_dumps({1: "x"}, indent=True)), {"1": "x"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -301,8 +301,9 @@ def test_required_none_reports_empty(monkeypatch):
     monkeypatch.setattr(nw.NsWebsocketUtils, "mcp_connection_gaps_fresh", AsyncMock(return_value=None))
     response = client.get("/api/v1/mcp/oauth/required/remote_net")
     assert response.status_code == 200
-    assert response.json()["missing"] == []
-    assert response.json()["needs_reauth"] == []
+    body = response.json()
+    assert body["missing"] == []
+    assert body["needs_reauth"] == []
 
 
 def test_required_degrades_when_freshen_fails(monkeypatch):
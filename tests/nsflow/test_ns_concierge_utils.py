@@ -0,0 +1,91 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+import asyncio
+import unittest
+
+import httpx
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from nsflow.backend.utils.agentutils.ns_concierge_utils import NsConciergeUtils
+from nsflow.backend.utils.tools.ns_configs_registry import NsConfigsRegistry
+
+
+def _refuse(request: httpx.Request) -> httpx.Response:
+    """MockTransport handler that fails every request the way a closed port does."""
+    raise httpx.ConnectError("Connection refused", request=request)
+
+
+class TestNsConciergeUtils(unittest.TestCase):
+    def tearDown(self):
+        NsConfigsRegistry.reset()
+
+    @staticmethod
+    def _list_status(host: str) -> int:
+        """Run list_concierge against a refusing transport and return the HTTPException status."""
+        NsConfigsRegistry.set_current("http", host, 8080)
+        concierge = NsConciergeUtils()
+
+        async def run() -> int:
+            # pylint: disable=protected-access  # swap the pooled client for one that refuses connections
+            concierge._http_client = httpx.AsyncClient(transport=httpx.MockTransport(_refuse))
+            concierge._http_client_loop = asyncio.get_running_loop()
+            # pylint: enable=protected-access
+            try:
+                await concierge.list_concierge({})
+            except HTTPException as exc:
+                return exc.status_code
+            return 200
+
+        return asyncio.run(run())
+
+    def test_get_metadata_matches_header_names_case_insensitively(self):
+        """Configured names match request headers in any case and are returned under the configured name."""
+        NsConfigsRegistry.set_current("http", "localhost", 8080)
+        concierge = NsConciergeUtils(forwarded_request_metadata="X-Request-Id user_id missing")
+        request = Request({"type": "http", "headers": [(b"x-request-id", b"abc"), (b"user_id", b"u1")]})
+
+        self.assertEqual(concierge.get_metadata(request), {"X-Request-Id": "abc", "user_id": "u1"})
+        self.assertEqual(NsConciergeUtils(forwarded_request_metadata="").get_metadata(request), {})
+
+    def test_refused_localhost_connection_is_503(self):
+        """A local server that refuses the connection is reported as not reachable."""
+        self.assertEqual(self._list_status("localhost"), 503)
+
+    def test_refused_remote_connection_is_502(self):
+        """Other hosts keep the bad-gateway response."""
+        self.assertEqual(self._list_status("neuro-san.example.com"), 502)
+
+    def test_pooled_clients_are_closed_on_replace_and_shutdown(self):
+        """A client left over from another event loop is closed when replaced; close_all() closes the rest."""
+        NsConfigsRegistry.set_current("http", "localhost", 8080)
+        concierge = NsConciergeUtils.get_instance()
+
+        # pylint: disable=protected-access  # checking the pooled client directly
+        first = asyncio.run(concierge._get_http_client())
+        second = asyncio.run(concierge._get_http_client())
+        # pylint: enable=protected-access
+        self.assertIsNot(first, second)
+        self.assertTrue(first.is_closed)
+
+        asyncio.run(NsConciergeUtils.close_all())
+        self.assertTrue(second.is_closed)
+        self.assertIsNot(NsConciergeUtils.get_instance(), concierge)
+        asyncio.run(NsConciergeUtils.close_all())
+
+
+if __name__ == "__main__":
+    unittest.main()
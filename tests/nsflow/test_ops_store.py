@@ -20,6 +20,7 @@ import unittest
 
 from nsflow.backend.utils.editor import ops_store
 from nsflow.backend.utils.editor.ops_store import OperationStore
+from nsflow.backend.utils.editor.simple_state_manager import SimpleStateManager
 
 
 class _FakeManager:  # pylint: disable=too-few-public-methods  # minimal test stand-in
@@ -58,6 +59,84 @@ class TestOperationStore(unittest.TestCase):
         self.assertEqual(OperationStore._read_jsonl(path), [{"a": 1}, {"b": 2}])
         # pylint: enable=protected-access
 
+    def test_save_draft_writes_meta_and_base(self):
+        """The first save_draft() writes the metadata and a full base snapshot with an empty delta log."""
+        store = OperationStore("design-2", _FakeManager())
+        os.remove(store.base_file)
+
+        self.assertTrue(store.save_draft())
+        # pylint: disable=protected-access  # reading back through our own json helpers
+        self.assertEqual(OperationStore._read_json(store.base_file), {"network_name": "net", "agents": {}})
+        self.assertEqual(OperationStore._read_json(store.meta_file)["network_name"], "net")
+        self.assertEqual(OperationStore._read_jsonl(store.delta_file), [])
+        # pylint: enable=protected-access
+
+    def test_save_draft_appends_deltas(self):
+        """After the first full snapshot, saves only append deltas that replay back to the current state."""
+        manager = _FakeManager()
+        store = OperationStore("design-3", manager)
+        self.assertTrue(store.save_draft())
+        base_size = os.path.getsize(store.base_file)
+
+        manager.get_state = lambda: {"network_name": "renamed", "agents": {"a": {"instructions": "hi"}}}
+        self.assertTrue(store.save_draft())
+        self.assertTrue(store.save_draft())
+
+        self.assertEqual(os.path.getsize(store.base_file), base_size)
+        # pylint: disable=protected-access  # reading back through our own jsonl helper
+        self.assertEqual(len(OperationStore._read_jsonl(store.delta_file)), 1)
+        # pylint: enable=protected-access
+        self.assertEqual(store.read_saved_state(), manager.get_state())
+
+    def test_save_draft_compacts_after_max_deltas(self):
+        """Once _MAX_STATE_DELTAS deltas are logged, the next save rewrites the base snapshot and empties the log."""
+        manager = _FakeManager()
+        store = OperationStore("design-4", manager)
+        self.assertTrue(store.save_draft())
+
+        for i in range(ops_store._MAX_STATE_DELTAS):  # pylint: disable=protected-access  # compaction threshold
+            manager.get_state = lambda i=i: {"network_name": f"net-{i}", "agents": {}}
+            self.assertTrue(store.save_draft())
+        # pylint: disable=protected-access  # reading back through our own json helpers
+        self.assertEqual(len(OperationStore._read_jsonl(store.delta_file)), ops_store._MAX_STATE_DELTAS)
+        self.assertEqual(OperationStore._read_json(store.base_file)["network_name"], "net")
+
+        manager.get_state = lambda: {"network_name": "compacted", "agents": {}}
+        self.assertTrue(store.save_draft())
+        self.assertEqual(OperationStore._read_jsonl(store.delta_file), [])
+        self.assertEqual(OperationStore._read_json(store.base_file), manager.get_state())
+        # pylint: enable=protected-access
+        self.assertEqual(store.read_saved_state(), manager.get_state())
+
+    def test_save_draft_skips_unchanged_state(self):
+        """A save with nothing changed since the last one leaves the draft files alone."""
+        store = OperationStore("design-5", _FakeManager())
+        self.assertTrue(store.save_draft())
+        with open(store.meta_file, "r", encoding="utf-8") as f:
+            meta = f.read()
+
+        self.assertTrue(store.save_draft())
+        with open(store.meta_file, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), meta)
+        # pylint: disable=protected-access  # reading back through our own json helper
+        self.assertEqual(OperationStore._read_jsonl(store.delta_file), [])
+        # pylint: enable=protected-access
+
+    def test_save_draft_after_revert_writes_state(self):
+        """Save at A, save at B, revert to A: the next save must write A, not skip it."""
+        manager = SimpleStateManager("design-6")
+        state_a = {"network_name": "a", "agents": {}}
+        manager.current_state = dict(state_a)
+        store = OperationStore("design-6", manager)
+
+        self.assertTrue(store.save_draft())
+        manager.current_state = {"network_name": "b", "agents": {}}
+        self.assertTrue(store.save_draft())
+        manager.current_state = dict(state_a)
+
+        self.assertTrue(store.save_draft())
+        self.assertEqual(store.read_saved_state(), state_a)
+
 
 if __name__ == "__main__":
     unittest.main()
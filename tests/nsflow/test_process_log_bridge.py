@@ -0,0 +1,108 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+import logging
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from nsflow.backend.utils.logutils.process_log_bridge import ProcessLogBridge
+
+# Interleaves flushed writes on both pipes, with \r and \r\n line endings and an unterminated last line
+_CHILD_SCRIPT = """
+import sys
+for i in range(3):
+    sys.stdout.write(f"out {i}\\n")
+    sys.stdout.flush()
+    sys.stderr.write(f"err {i}\\n")
+    sys.stderr.flush()
+sys.stdout.write("progress 1\\rprogress 2\\r\\n")
+sys.stdout.flush()
+sys.stderr.write("tail without newline")
+"""
+
+
+@unittest.skipIf(os.name == "nt", "the selector drain is POSIX-only")
+class TestProcessLogBridgeSelectorDrain(unittest.TestCase):
+    def setUp(self):
+        """ProcessLogBridge reconfigures the root logger, so keep its setup to restore afterwards."""
+        self.tmp_dir = tempfile.mkdtemp()
+        root = logging.getLogger()
+        self._root_handlers = root.handlers[:]
+        self._root_level = root.level
+
+    def tearDown(self):
+        root = logging.getLogger()
+        root.handlers[:] = self._root_handlers
+        root.setLevel(self._root_level)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_drains_interleaved_stdout_and_stderr(self):
+        """Every line of both pipes reaches its stream, split the way text-mode readline would split it."""
+        bridge = ProcessLogBridge(level="CRITICAL")
+        handled = []
+        # pylint: disable=protected-access  # record lines instead of rendering them, then watch the drain thread
+        bridge._handle_line = lambda state, line, tee=True: handled.append((id(state), line))
+
+        log_file = os.path.join(self.tmp_dir, "child.log")
+        # Closed by the drain thread at EOF, like the runner's own processes
+        process = subprocess.Popen(  # pylint: disable=consider-using-with
+            [sys.executable, "-c", _CHILD_SCRIPT], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        bridge.attach_process_logger(process, "child", log_file)
+
+        # The shared drain thread clears itself once both pipes hit EOF
+        deadline = time.monotonic() + 10
+        while bridge._selector_thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIsNone(bridge._selector_thread)
+        self.assertEqual(process.wait(timeout=10), 0)
+        streams = {tag: id(state) for (_, tag), state in bridge._streams.items()}
+        # pylint: enable=protected-access
+
+        stdout_lines = [line for key, line in handled if key == streams["STDOUT"]]
+        stderr_lines = [line for key, line in handled if key == streams["STDERR"]]
+        self.assertEqual(stdout_lines, ["out 0", "out 1", "out 2", "progress 1", "progress 2"])
+        self.assertEqual(stderr_lines, ["err 0", "err 1", "err 2", "tail without newline"])
+
+        with open(log_file, encoding="utf-8") as f:
+            self.assertCountEqual(f.read().splitlines(), stdout_lines + stderr_lines)
+
+
+class TestProcessLogBridgeJsonParsing(unittest.TestCase):
+    def test_non_finite_numbers_parse_as_json(self):
+        """NaN, Infinity and out-of-range floats are valid for the stdlib parser, so the line stays a JSON record."""
+        # pylint: disable=protected-access  # parsing helper under test
+        record = ProcessLogBridge._try_parse_json_fragment('{"a": NaN, "b": Infinity, "c": 1e400}')
+        # pylint: enable=protected-access
+        self.assertTrue(math.isnan(record["a"]))
+        self.assertEqual(record["b"], math.inf)
+        self.assertEqual(record["c"], math.inf)
+
+    def test_big_integers_keep_their_value(self):
+        """Integers wider than 64 bits are parsed exactly instead of being rounded to floats."""
+        # pylint: disable=protected-access  # parsing helper under test
+        record = ProcessLogBridge._try_parse_json_fragment('{"id": 123456789012345678901234567890}')
+        # pylint: enable=protected-access
+        self.assertEqual(record, {"id": 123456789012345678901234567890})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+import unittest
+
+from nsflow.backend.utils.editor.simple_state_manager import SimpleStateManager
+
+_META = {"created_at": "2025-01-01T00:00:00", "updated_at": "2025-01-01T00:00:00", "version": 1}
+
+
+class TestSimpleStateManager(unittest.TestCase):
+    def test_cached_validation_follows_replaced_state(self):
+        """Replacing the state invalidates the cached result even when meta.updated_at is identical."""
+        manager = SimpleStateManager("design-1")
+        manager.current_state = {"network_name": "net", "agents": {}, "meta": dict(_META)}
+        self.assertFalse(manager.cached_validation()["valid"])
+
+        manager.current_state = {"network_name": "net", "agents": {"front": {"tools": []}}, "meta": dict(_META)}
+        self.assertTrue(manager.cached_validation()["valid"])
+
+    def test_cached_validation_follows_in_place_edits(self):
+        """Edits made through the manager invalidate the cached result."""
+        manager = SimpleStateManager("design-2")
+        manager.current_state = {"network_name": "net", "agents": {"front": {"tools": []}}, "meta": dict(_META)}
+        self.assertTrue(manager.cached_validation()["valid"])
+
+        self.assertTrue(manager.delete_agent("front"))
+        self.assertFalse(manager.cached_validation()["valid"])
+
+    def test_repeated_update_is_applied_once(self):
+        """An identical update is skipped until something else changes the state, whatever the timestamps say."""
+        manager = SimpleStateManager("design-3")
+        manager.current_state = {"network_name": "net", "agents": {}, "meta": dict(_META)}
+        update = {"agent_network_name": "net", "agent_network_definition": {"front": {"tools": []}}}
+
+        self.assertTrue(manager.update_network_state("net", update, source="logs"))
+        self.assertTrue(manager.update_network_state("net", update, source="logs"))
+        self.assertEqual(len(manager.state_history), 1)
+
+        self.assertTrue(manager.set_network_name("renamed"))
+        self.assertTrue(manager.update_network_state("net", update, source="logs"))
+        self.assertEqual(len(manager.state_history), 3)
+        self.assertEqual(manager.peek_state()["network_name"], "net")
+
+
+if __name__ == "__main__":
+    unittest.main()
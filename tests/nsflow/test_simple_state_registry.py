@@ -0,0 +1,63 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+import json
+import unittest
+
+from nsflow.backend.utils.editor import simple_state_registry
+from nsflow.backend.utils.editor.simple_state_manager import SimpleStateManager
+from nsflow.backend.utils.editor.simple_state_registry import SimpleStateRegistry
+
+
+class TestEncodeScalar(unittest.TestCase):
+    def test_matches_json_dumps(self):
+        """HOCON leaves come out byte-identical to json.dumps, whether or not orjson handles them."""
+        values = [
+            "plain",
+            'quote " and \\ backslash\n',
+            "café",
+            "del\x7f",
+            0,
+            2**70,
+            1.5e-7,
+            float("nan"),
+            float("inf"),
+            True,
+            None,
+            [0, "s", [1.0]],
+            {"a": 1},
+        ]
+        for value in values:
+            # pylint: disable=protected-access  # module-private encoder under test
+            self.assertEqual(simple_state_registry._encode_scalar(value), json.dumps(value), repr(value))
+
+
+class TestPrimaryManager(unittest.TestCase):
+    def test_equal_updated_at_prefers_latest_created(self):
+        """Sessions updated at the same instant are ordered by created_at, whatever the set order."""
+        for order in (("old", "new"), ("new", "old")):
+            registry = SimpleStateRegistry()
+            for design_id in order:
+                manager = SimpleStateManager(design_id)
+                created_at = "2025-01-02T00:00:00" if design_id == "new" else "2025-01-01T00:00:00"
+                manager.current_state = {"meta": {"updated_at": "2025-01-03T00:00:00", "created_at": created_at}}
+                registry.managers[design_id] = manager
+            registry.network_to_design_ids["net"] = set(order)
+
+            self.assertIs(registry.get_primary_manager_for_network("net"), registry.managers["new"])
+
+
+if __name__ == "__main__":
+    unittest.main()